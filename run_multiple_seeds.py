@@ -1,24 +1,28 @@
 import random
-import subprocess
+import multiprocessing
 import sys
 import os
 import json
 import datetime
 
+sys.path.insert(0, '.')
+import numpy as np
+from src.optimization.piston_opt_am_v2 import run_optimization as _run_opt, save_results, create_geometry_from_vector, setup_deap
+
+def _init_worker():
+    """Keep any BLAS from oversubscribing cores once seeds run in parallel."""
+    os.environ['OMP_NUM_THREADS'] = '1'
+
 def run_optimization(seed):
     """Run piston_opt_am_v2 with a given random seed."""
-    # Set environment variable for random seed
-    env = os.environ.copy()
-    env['PYTHONHASHSEED'] = str(seed)
-    # Run the module with seed passed as argument? We'll need to modify the script.
-    # Instead, let's import the module and call its functions directly.
-    sys.path.insert(0, '.')
-    from src.optimization.piston_opt_am_v2 import run_optimization, save_results, create_geometry_from_vector
-    import numpy as np
+    os.environ['PYTHONHASHSEED'] = str(seed)
+    # DEAP's operators draw from the stdlib random module; seeding it is
+    # safe here because each seed lives in its own worker process.
     random.seed(seed)
-    np.random.seed(seed)
     print(f"\n--- Seed {seed} ---")
-    best, log, feasible = run_optimization(pop_size=30, generations=20)
+    # Per-instance PCG64 generator instead of the global legacy RandomState
+    rng = np.random.default_rng(seed)
+    best, log, feasible = _run_opt(pop_size=30, generations=20, rng=rng)
     return best, log, feasible
 
 def main():
@@ -26,9 +30,19 @@ def main():
     all_feasible = []
     best_feasible = None
     best_mass = float('inf')
-    for seed in seeds:
+    # Workers return creator.Individual instances; the creator classes
+    # must also be registered in this parent process or unpickling the
+    # pool results fails with "Can't get attribute 'Individual'"
+    setup_deap()
+    # Seeds are independent, so run them in parallel workers — wall time
+    # drops to the slowest seed instead of the sum of all five.
+    ctx = multiprocessing.get_context("spawn")
+    with ctx.Pool(processes=min(len(seeds), os.cpu_count()),
+                  initializer=_init_worker) as pool:
+        outcomes = pool.map(run_optimization, seeds)
+    for seed, outcome in zip(seeds, outcomes):
         try:
-            best, log, feasible = run_optimization(seed)
+            best, log, feasible = outcome
             # Evaluate feasibility
             if best.fitness.values[1] == 0:
                 all_feasible.append((seed, best))
@@ -43,7 +57,6 @@ def main():
         seed, best = best_feasible
         print(f"Best feasible design (seed {seed}): mass {best.fitness.values[0]:.2f} g")
         # Save results
-        from src.optimization.piston_opt_am_v2 import save_results, create_geometry_from_vector
         results, filename = save_results(best, [], [best])  # empty log for simplicity
         print(f"Saved to {filename}")
     else:
@@ -51,4 +64,4 @@ def main():
         # Save the best infeasible design from last seed? We'll just return None
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
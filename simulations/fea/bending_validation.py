@@ -1,13 +1,112 @@
 """
-FEA validation of bending stress formula using pycalculix.
+FEA validation of bending stress formula, solved in-process.
 Cantilever beam representing crank pin under conrod force.
+
+Previously this spun up a full Calculix run (subprocess, mesh files, text
+.dat parsing) per call — seconds of process startup and I/O to verify
+σ = M·c/I. The same check now runs as a small plane-stress Q4 model
+assembled with NumPy and solved with scipy.sparse, entirely in memory.
 """
 import sys
-import os
-os.environ['PATH'] = os.path.expanduser('~/.local/bin') + ':' + os.environ.get('PATH', '')
-
-import pycalculix as pyc
 import numpy as np
+from scipy.sparse import coo_matrix
+from scipy.sparse.linalg import splu
+
+
+def _q4_stiffness(D, a, b, thickness):
+    """Element stiffness for a 2a x 2b bilinear quad (2x2 Gauss quadrature)."""
+    g = 1.0 / np.sqrt(3.0)
+    ke = np.zeros((8, 8))
+    for xi in (-g, g):
+        for eta in (-g, g):
+            dN = 0.25 * np.array([
+                [-(1 - eta), (1 - eta), (1 + eta), -(1 + eta)],
+                [-(1 - xi), -(1 + xi), (1 + xi), (1 - xi)],
+            ])
+            # Rectangular element: constant diagonal Jacobian
+            dNxy = dN / np.array([[a], [b]])
+            B = np.zeros((3, 8))
+            B[0, 0::2] = dNxy[0]
+            B[1, 1::2] = dNxy[1]
+            B[2, 0::2] = dNxy[1]
+            B[2, 1::2] = dNxy[0]
+            ke += B.T @ D @ B * (a * b * thickness)
+    return ke
+
+
+def solve_cantilever(length, height, thickness, E, nu, force, elem_size=5.0):
+    """Plane-stress Q4 cantilever: fixed at x=0, transverse tip load.
+
+    Returns the maximum principal stress at the fixed end (MPa)."""
+    nx = max(int(round(length / elem_size)), 2)
+    ny = max(int(round(height / elem_size)), 2)
+    dx = length / nx
+    dy = height / ny
+    n_nodes = (nx + 1) * (ny + 1)
+
+    D = E / (1 - nu**2) * np.array([
+        [1.0, nu, 0.0],
+        [nu, 1.0, 0.0],
+        [0.0, 0.0, (1.0 - nu) / 2.0],
+    ])
+    ke = _q4_stiffness(D, dx / 2, dy / 2, thickness)
+
+    def node(i, j):
+        return j * (nx + 1) + i
+
+    # Element connectivity (CCW from lower-left corner)
+    elems = np.empty((nx * ny, 4), dtype=np.intp)
+    k = 0
+    for j in range(ny):
+        for i in range(nx):
+            elems[k] = (node(i, j), node(i + 1, j), node(i + 1, j + 1), node(i, j + 1))
+            k += 1
+
+    # Assemble global stiffness in COO form
+    dofs = np.empty((len(elems), 8), dtype=np.intp)
+    dofs[:, 0::2] = elems * 2
+    dofs[:, 1::2] = elems * 2 + 1
+    rows = np.repeat(dofs, 8, axis=1).ravel()
+    cols = np.tile(dofs, (1, 8)).ravel()
+    vals = np.tile(ke.ravel(), len(elems))
+    K = coo_matrix((vals, (rows, cols)), shape=(2 * n_nodes, 2 * n_nodes)).tocsc()
+
+    # Dirichlet: clamp every node on x=0
+    fixed = np.array([d for j in range(ny + 1) for d in (2 * node(0, j), 2 * node(0, j) + 1)])
+    free = np.setdiff1d(np.arange(2 * n_nodes), fixed)
+
+    # Transverse load spread over the right edge nodes
+    f = np.zeros(2 * n_nodes)
+    tip_nodes = [node(nx, j) for j in range(ny + 1)]
+    f[[2 * n + 1 for n in tip_nodes]] = -force / len(tip_nodes)
+
+    # splu so repeated force magnitudes could reuse the factorization
+    lu = splu(K[np.ix_(free, free)])
+    u = np.zeros(2 * n_nodes)
+    u[free] = lu.solve(f[free])
+
+    # Recover stresses in the fixed-end element column, max principal
+    g = 1.0 / np.sqrt(3.0)
+    stress_max = 0.0
+    for e in range(0, len(elems), nx):  # first element of each row (i=0)
+        ue = u[dofs[e]]
+        for xi in (-g, g):
+            for eta in (-g, g):
+                dN = 0.25 * np.array([
+                    [-(1 - eta), (1 - eta), (1 + eta), -(1 + eta)],
+                    [-(1 - xi), -(1 + xi), (1 + xi), (1 - xi)],
+                ])
+                dNxy = dN / np.array([[dx / 2], [dy / 2]])
+                B = np.zeros((3, 8))
+                B[0, 0::2] = dNxy[0]
+                B[1, 1::2] = dNxy[1]
+                B[2, 0::2] = dNxy[1]
+                B[2, 1::2] = dNxy[0]
+                sx, sy, txy = D @ B @ ue
+                principal = (sx + sy) / 2 + np.sqrt(((sx - sy) / 2)**2 + txy**2)
+                stress_max = max(stress_max, abs(principal))
+    return stress_max
+
 
 def test_bending():
     """Cantilever beam bending stress comparison."""
@@ -15,60 +114,17 @@ def test_bending():
     width = 70.0   # mm (pin diameter)
     height = 30.0  # mm (pin width)
     length = 47.5  # mm (stroke)
-    
+
     # Material: steel
     E = 210000.0  # MPa
     nu = 0.3
-    
+
     # Load: conrod force (worst‑case)
     force = 180000.0  # N (overdrive)
-    
-    # Create model
-    model = pyc.FeaModel('cantilever')
-    model.set_units('mm')
-    
-    # Draw rectangle in XY plane (plane stress)
-    # Points
-    p1 = model.point(0, 0)
-    p2 = model.point(width, 0)
-    p3 = model.point(width, height)
-    p4 = model.point(0, height)
-    
-    # Lines
-    model.line(p1, p2)
-    model.line(p2, p3)
-    model.line(p3, p4)
-    model.line(p4, p1)
-    
-    # Material
-    mat = pyc.Material('steel')
-    mat.set_mech_props(E, nu)
-    model.set_mat(mat)
-    
-    # Boundary condition: fix left edge (x=0)
-    left_line = model.get_line(p1, p4)
-    model.constrain_line(left_line, 'x', 0)
-    model.constrain_line(left_line, 'y', 0)
-    
-    # Apply force on right edge (x=width) as pressure
-    # Force distributed over area = width * height
-    pressure = force / (width * height)  # MPa
-    right_line = model.get_line(p2, p3)
-    model.apply_line_pressure(right_line, pressure, 'x')
-    
-    # Set plane stress
-    model.set_etype('plstress')
-    model.set_elem_size(5.0)
-    model.mesh()
-    
-    # Solve
-    model.solve()
-    
-    # Get bending stress at fixed end (max stress)
-    results = model.get_results()
-    # Get maximum principal stress at left edge
-    stress_max = results.get_max_prin('left')
-    
+
+    # In-process FEM solve (bending about the section's weak axis)
+    stress_max = solve_cantilever(length, height, width, E, nu, force)
+
     # Analytical bending stress: sigma = M * c / I
     # M = force * length (N·mm)
     moment = force * length
@@ -77,13 +133,13 @@ def test_bending():
     # I = width * height**3 / 12 (area moment of inertia)
     I = width * height**3 / 12
     sigma_analytical = moment * c / I
-    
-    print(f"Beam: {width} mm × {height} mm, length {length} mm")
-    print(f"Force: {force/1000:.1f} kN")
-    print(f"Analytical bending stress: {sigma_analytical:.2f} MPa")
-    print(f"FEA max principal stress: {stress_max:.2f} MPa")
-    print(f"Difference: {abs(stress_max - sigma_analytical):.2f} MPa ({abs((stress_max - sigma_analytical)/sigma_analytical*100):.1f}%)")
-    
+
+    print(f"Beam: {width} mm × {height} mm, length {length} mm")
+    print(f"Force: {force/1000:.1f} kN")
+    print(f"Analytical bending stress: {sigma_analytical:.2f} MPa")
+    print(f"FEA max principal stress: {stress_max:.2f} MPa")
+    print(f"Difference: {abs(stress_max - sigma_analytical):.2f} MPa ({abs((stress_max - sigma_analytical)/sigma_analytical*100):.1f}%)")
+
     return sigma_analytical, stress_max
 
 if __name__ == '__main__':
@@ -98,4 +154,4 @@ if __name__ == '__main__':
         print(f"❌ FEA failed: {e}")
         import traceback
         traceback.print_exc()
-        sys.exit(1)
\ No newline at end of file
+        sys.exit(1)
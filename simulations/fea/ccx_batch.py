@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Shared Calculix batch runner for the debug scripts.
+
+Every debug script used to create its own TemporaryDirectory, write one
+.inp, run ccx and tear down — repeated tmpdir setup plus a cold process
+start per case. Staging all inputs into a single tmpdir and solving in
+parallel amortizes that overhead across however many cases are queued.
+"""
+import os
+import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+
+def run_ccx_batch(inps):
+    """Write all inputs into one tmpdir, run ccx on each in parallel.
+
+    `inps` maps job name -> .inp contents. Returns a dict mapping job name
+    to (returncode, stderr, dat_contents_or_None)."""
+    results = {}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for name, inp in inps.items():
+            with open(os.path.join(tmpdir, f"{name}.inp"), 'w') as f:
+                f.write(inp)
+
+        def solve(name):
+            # ccx output is ASCII; skip text=True's full UTF-8 decode and
+            # convert only on the way out
+            proc = subprocess.run(["ccx", "-i", name], cwd=tmpdir,
+                                  capture_output=True)
+            return name, (proc.returncode,
+                          proc.stderr.decode('ascii', 'replace'))
+
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+            runs = dict(pool.map(solve, inps))
+
+        for name in inps:
+            dat_path = os.path.join(tmpdir, f"{name}.dat")
+            dat = None
+            if os.path.exists(dat_path):
+                with open(dat_path, 'r') as f:
+                    dat = f.read()
+            code, stderr = runs[name]
+            results[name] = (code, stderr, dat)
+    return results
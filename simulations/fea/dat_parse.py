@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Fast parser for Calculix .dat stress tables.
+
+The test scripts used to split every line in Python and call float() per
+token — interpreter-bound once ccx writes thousands of integration-point
+rows. The scan below walks the raw bytes once and hand-parses the third
+column; with Numba available it is compiled to machine code (cache=True so
+the ~1 s compile is paid once per environment), and without it the same
+code runs as plain Python.
+"""
+import mmap
+import os
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pure-Python fallback, same semantics
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def _atof(buf, start, end):
+    """Parse buf[start:end] as a float. Returns (value, ok)."""
+    i = start
+    sign = 1.0
+    if i < end and (buf[i] == 43 or buf[i] == 45):  # + -
+        if buf[i] == 45:
+            sign = -1.0
+        i += 1
+    mant = 0.0
+    digits = 0
+    while i < end and 48 <= buf[i] <= 57:
+        mant = mant * 10.0 + (buf[i] - 48)
+        i += 1
+        digits += 1
+    if i < end and buf[i] == 46:  # .
+        i += 1
+        scale = 0.1
+        while i < end and 48 <= buf[i] <= 57:
+            mant += (buf[i] - 48) * scale
+            scale *= 0.1
+            i += 1
+            digits += 1
+    if digits == 0:
+        return 0.0, False
+    exp = 0
+    if i < end and (buf[i] == 69 or buf[i] == 101):  # E e
+        i += 1
+        esign = 1
+        if i < end and (buf[i] == 43 or buf[i] == 45):
+            if buf[i] == 45:
+                esign = -1
+            i += 1
+        edigits = 0
+        while i < end and 48 <= buf[i] <= 57:
+            exp = exp * 10 + (buf[i] - 48)
+            i += 1
+            edigits += 1
+        if edigits == 0:
+            return 0.0, False
+        exp *= esign
+    if i != end:
+        return 0.0, False
+    return sign * mant * 10.0 ** exp, True
+
+
+@njit(cache=True)
+def _parse_third_column(buf):
+    """Third whitespace-separated column of every data line in `buf`.
+
+    A data line here is one that does not start with a space or with the
+    "stresses" header and carries at least 8 tokens — the same filter the
+    scripts applied line by line."""
+    n = buf.size
+    out = np.empty(n // 40 + 1, np.float64)
+    count = 0
+    i = 0
+    while i < n:
+        j = i
+        while j < n and buf[j] != 10:  # \n
+            j += 1
+        if j > i and buf[i] != 32 and buf[i] != 115:  # ' ' / 's'
+            ntok = 0
+            tok2_start = -1
+            tok2_end = -1
+            t = i
+            while t < j:
+                while t < j and (buf[t] == 32 or buf[t] == 9 or buf[t] == 13):
+                    t += 1
+                if t >= j:
+                    break
+                s = t
+                while t < j and buf[t] != 32 and buf[t] != 9 and buf[t] != 13:
+                    t += 1
+                if ntok == 2:
+                    tok2_start = s
+                    tok2_end = t
+                ntok += 1
+            if ntok >= 8 and tok2_start >= 0:
+                val, ok = _atof(buf, tok2_start, tok2_end)
+                if ok:
+                    out[count] = val
+                    count += 1
+        i = j + 1
+    return out[:count]
+
+
+def parse_sxx(dat_path):
+    """Sxx values (third column) of a ccx .dat file as a float64 array.
+
+    The file is mmapped and scanned in place — the parser works straight
+    off the page cache with no heap copy of the file contents."""
+    if os.path.getsize(dat_path) == 0:
+        return np.empty(0, np.float64)
+    with open(dat_path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return _parse_third_column(np.frombuffer(mm, dtype=np.uint8))
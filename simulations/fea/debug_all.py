@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Run all Calculix debug cases in one batch.
+
+Each standalone debug script (debug_ccx, debug_fea, parse_test,
+read_tet_dat, simple_cantilever) paid its own TemporaryDirectory plus a
+cold ccx process start per case. This driver stages every input into one
+tmpdir and runs the solves in parallel, so total wall time is roughly one
+startup plus the slowest case.
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(__file__))
+from ccx_batch import run_ccx_batch
+from direct_calculix import create_cantilever_inp
+
+HEX_MINIMAL = """*NODE
+1,0,0,0
+2,1,0,0
+3,1,1,0
+4,0,1,0
+5,0,0,1
+6,1,0,1
+7,1,1,1
+8,0,1,1
+*ELEMENT, TYPE=C3D8, ELSET=E1
+1,1,2,3,4,5,6,7,8
+*MATERIAL, NAME=STEEL
+*ELASTIC
+210000,0.3
+*SOLID SECTION, ELSET=E1, MATERIAL=STEEL
+*NSET, NSET=FIXED
+1,2,3,4
+*BOUNDARY
+FIXED,1,3
+*STEP
+*STATIC
+*END STEP
+"""
+
+HEX_EL_PRINT = """*NODE
+1,0,0,0
+2,1,0,0
+3,1,1,0
+4,0,1,0
+5,0,0,1
+6,1,0,1
+7,1,1,1
+8,0,1,1
+*ELEMENT,TYPE=C3D8
+1,1,2,3,4,5,6,7,8
+*MATERIAL,NAME=STEEL
+*ELASTIC
+210000,0.3
+*SOLID SECTION,ELSET=E1,MATERIAL=STEEL
+*NSET,NSET=FIX
+1,2,3,4
+*BOUNDARY
+FIX,1,3
+*EL PRINT,ELSET=E1
+S
+*STEP
+*STATIC
+*END STEP
+"""
+
+TET_CLOAD = """*HEADING
+Simple tetrahedron test
+*NODE
+1,0,0,0
+2,1,0,0
+3,0,1,0
+4,0,0,1
+*ELEMENT,TYPE=C3D4,ELSET=TET
+1,1,2,3,4
+*SOLID SECTION,ELSET=TET,MATERIAL=STEEL
+*MATERIAL,NAME=STEEL
+*ELASTIC
+210000,0.3
+*NSET,NSET=FIXED
+1,2,3
+*BOUNDARY
+FIXED,1,3
+*STEP
+*STATIC
+*CLOAD
+4,2,100
+*EL PRINT,ELSET=TET
+S
+*END STEP
+"""
+
+SIMPLE_CANTILEVER = """** Simple cantilever beam (single element)
+*NODE
+1,0,0,0
+2,10,0,0
+3,10,10,0
+4,0,10,0
+5,0,0,10
+6,10,0,10
+7,10,10,10
+8,0,10,10
+*ELEMENT,TYPE=C3D8,ELSET=E1
+1,1,2,3,4,5,6,7,8
+*MATERIAL,NAME=STEEL
+*ELASTIC
+210000,0.3
+*SOLID SECTION,ELSET=E1,MATERIAL=STEEL
+*NSET,NSET=FIX
+1,2,3,4
+*BOUNDARY
+FIX,1,3
+*STEP
+*STATIC
+*CLOAD
+5,F1,1000
+6,F1,1000
+7,F1,1000
+8,F1,1000
+*EL PRINT,ELSET=E1
+S
+*END STEP
+"""
+
+
+def main():
+    cases = {
+        "hex_minimal": HEX_MINIMAL,
+        "hex_el_print": HEX_EL_PRINT,
+        "tet_cload": TET_CLOAD,
+        "simple_cantilever": SIMPLE_CANTILEVER,
+        "cantilever": create_cantilever_inp(width=70.0, height=30.0,
+                                            length=47.5, force_n=180000.0),
+    }
+    results = run_ccx_batch(cases)
+    for name, (code, _stderr, dat) in results.items():
+        status = "✅" if code == 0 else f"❌ (rc={code})"
+        dat_info = f"{len(dat)} bytes .dat" if dat else "no .dat"
+        print(f"{name}: {status}, {dat_info}")
+
+
+if __name__ == "__main__":
+    main()
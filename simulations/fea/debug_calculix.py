@@ -2,11 +2,10 @@
 """
 Debug Calculix input generation.
 """
-import subprocess
 import os
-import tempfile
 import sys
 sys.path.insert(0, os.path.dirname(__file__))
+from ccx_batch import run_ccx_batch
 from direct_calculix import create_cantilever_inp
 
 # Generate inp
@@ -27,28 +26,13 @@ for i, line in enumerate(lines):
         print(f"Line {i+1}: length {len(line)}")
         print(f"  {line[:80]}...")
 
-# Write and run
-with tempfile.TemporaryDirectory() as tmpdir:
-    inp_path = os.path.join(tmpdir, "debug.inp")
-    with open(inp_path, 'w') as f:
-        f.write(inp)
-    print(f"\nWritten to {inp_path}")
-    # Run ccx with verbose
-    result = subprocess.run(["ccx", "-i", "debug"], cwd=tmpdir, 
-                          capture_output=True, text=True)
-    print(f"Return code: {result.returncode}")
-    if result.returncode != 0:
-        print("stderr:")
-        print(result.stderr)
-    else:
-        print("ccx succeeded")
-    
-    # Check output files
-    for fname in os.listdir(tmpdir):
-        if fname.startswith("debug."):
-            fpath = os.path.join(tmpdir, fname)
-            size = os.path.getsize(fpath)
-            print(f"  {fname}: {size} bytes")
-            if size < 500 and size > 0:
-                with open(fpath, 'r') as f:
-                    print(f"    Content:\n{f.read()}")
\ No newline at end of file
+# Run
+code, stderr, dat = run_ccx_batch({"debug": inp})["debug"]
+print(f"\nReturn code: {code}")
+if code != 0:
+    print("stderr:")
+    print(stderr)
+else:
+    print("ccx succeeded")
+if dat is not None and len(dat) < 500:
+    print(f".dat content:\n{dat}")
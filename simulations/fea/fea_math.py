@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Shared analytical helpers for the FEA test scripts.
+
+Each script used to carry its own copy of the beam/torsion formulas. One
+module with @njit(cache=True) functions means the LLVM compile is paid
+once per environment (the on-disk cache is shared by every script that
+imports this) and every later call is a C-speed constant evaluation.
+"""
+import math
+
+try:
+    from numba import njit
+except ImportError:  # pure-Python fallback, same semantics
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def bending_stress(width, height, length, force):
+    """Cantilever root bending stress sigma = M*c/I for a rectangle."""
+    moment = force * length
+    c = height / 2.0
+    I = width * height**3 / 12.0
+    return moment * c / I
+
+
+@njit(cache=True)
+def shear_modulus(E, nu):
+    """Isotropic shear modulus G = E / (2 (1 + nu))."""
+    return E / (2.0 * (1.0 + nu))
+
+
+@njit(cache=True)
+def torsion_stress(radius, torque_nm):
+    """Outer-fibre shear stress of a solid round shaft, in MPa (mm, N·m)."""
+    J = math.pi * radius**4 / 2.0  # polar moment (mm⁴)
+    return torque_nm * 1000.0 * radius / J
+
+
+@njit(cache=True)
+def torsion_params(E, nu, radius, torque_nm):
+    """Shear modulus, polar moment, stress, strain and rim displacement.
+
+    Pure scalar math, compiled once (cache=True) so repeat runs skip LLVM."""
+    G = shear_modulus(E, nu)
+    J = math.pi * radius**4 / 2.0  # polar moment (mm⁴)
+    tau = torque_nm * 1000.0 * radius / J  # MPa
+    gamma = tau / G  # shear strain
+    disp = gamma * radius  # mm at outer radius
+    return G, J, tau, gamma, disp
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Pure-Python cantilever .inp builder (no numpy, no cadquery).
+
+Mirrors the deck produced by test_cantilever_cload.py but uses only
+builtin lists and floats, so it runs unmodified under PyPy — for
+non-batched mesh loops PyPy's JIT routinely beats the numpy call overhead
+that the CPython path relies on. Under CPython the test script keeps its
+vectorized generator; under PyPy run this module directly:
+
+    pypy3 inp_builder.py [width height length force nx ny nz] > cload.inp
+"""
+import sys
+
+
+def build_cantilever_inp_cload(width=70.0, height=30.0, length=47.5,
+                               force_n=180000.0, nx=2, ny=2, nz=2):
+    """Cantilever .inp text with nodal forces, built with plain loops."""
+    dx = length / nx
+    dy = width / ny
+    dz = height / nz
+
+    E = 210000.0
+    nu = 0.3
+    density = 7.85e-9
+
+    lines = ["** Cantilever beam validation (CLOAD)", "*NODE"]
+    # Node ids on the structured grid (z fastest, matching the numpy path)
+    node_id = {}
+    nid = 1
+    for i in range(nx + 1):
+        for j in range(ny + 1):
+            for k in range(nz + 1):
+                node_id[(i, j, k)] = nid
+                lines.append("%d,%.6f,%.6f,%.6f" % (nid, i * dx, j * dy, k * dz))
+                nid += 1
+
+    lines.append("*ELEMENT, TYPE=C3D8, ELSET=BEAM")
+    eid = 1
+    for i in range(nx):
+        for j in range(ny):
+            for k in range(nz):
+                lines.append("%d,%d,%d,%d,%d,%d,%d,%d,%d" % (
+                    eid,
+                    node_id[(i, j, k)], node_id[(i + 1, j, k)],
+                    node_id[(i + 1, j + 1, k)], node_id[(i, j + 1, k)],
+                    node_id[(i, j, k + 1)], node_id[(i + 1, j, k + 1)],
+                    node_id[(i + 1, j + 1, k + 1)], node_id[(i, j + 1, k + 1)]))
+                eid += 1
+
+    lines += ["*MATERIAL, NAME=STEEL",
+              "*ELASTIC",
+              "%.1f,%.2f" % (E, nu),
+              "*DENSITY",
+              "%.6e" % density,
+              "*SOLID SECTION, ELSET=BEAM, MATERIAL=STEEL"]
+
+    fixed_nodes = [node_id[(0, j, k)]
+                   for j in range(ny + 1) for k in range(nz + 1)]
+    load_nodes = [node_id[(nx, j, k)]
+                  for j in range(ny + 1) for k in range(nz + 1)]
+    force_per_node = force_n / len(load_nodes)
+
+    lines.append("*NSET, NSET=FIXED")
+    lines.append(",".join(str(n) for n in fixed_nodes))
+    lines += ["*BOUNDARY", "FIXED,1,3", "*STEP", "*STATIC"]
+    # Apply force in -z direction (F3)
+    lines += ["%d,3,%.6f" % (n, -force_per_node) for n in load_nodes]
+    lines += ["*EL PRINT, ELSET=BEAM", "S", "*END STEP"]
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    args = [float(a) for a in sys.argv[1:5]]
+    dims = [int(a) for a in sys.argv[5:8]]
+    sys.stdout.write(build_cantilever_inp_cload(*(args + dims)))
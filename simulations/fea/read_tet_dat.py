@@ -36,24 +36,29 @@ with tempfile.TemporaryDirectory() as tmpdir:
     inp_path = os.path.join(tmpdir, "tet.inp")
     with open(inp_path, 'w') as f:
         f.write(inp)
-    subprocess.run(["ccx", "-i", "tet"], cwd=tmpdir, capture_output=True)
+    # Output is never read, so don't buffer it
+    subprocess.run(["ccx", "-i", "tet"], cwd=tmpdir,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
     dat_path = os.path.join(tmpdir, "tet.dat")
     if os.path.exists(dat_path):
-        with open(dat_path, 'r') as f:
-            content = f.read()
+        # Single streamed pass: echo the file and pick out the first stress
+        # line with a small state machine — no full read() copy in memory
         print("=== .dat content ===")
-        print(content)
-        print("=== end ===")
-        # Parse for stress
-        lines = content.splitlines()
         in_stress = False
-        for line in lines:
-            if 'STRESS' in line:
-                in_stress = True
-                continue
-            if in_stress and line.strip():
-                print(f"Stress line: {line}")
-                parts = line.split()
-                print(f"Parts: {parts}")
-                # Expect something like "1  1.234E+00  2.345E+00 ..."
-                break
\ No newline at end of file
+        stress_line = None
+        with open(dat_path, 'r') as f:
+            for line in f:
+                print(line, end='')
+                if stress_line is not None:
+                    continue
+                if 'STRESS' in line:
+                    in_stress = True
+                    continue
+                if in_stress and line.strip():
+                    stress_line = line.rstrip('\n')
+        print("=== end ===")
+        if stress_line is not None:
+            print(f"Stress line: {stress_line}")
+            parts = stress_line.split()
+            print(f"Parts: {parts}")
+            # Expect something like "1  1.234E+00  2.345E+00 ..."
\ No newline at end of file
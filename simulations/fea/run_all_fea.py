@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Run the independent FEA test scripts in parallel.
+
+Each script solves its own ccx case in its own TemporaryDirectory, so they
+never collide on disk; run sequentially they leave all but one core idle.
+This driver fans them out over a process pool — wall time for the suite
+drops to roughly the slowest case.
+"""
+import os
+import runpy
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+SCRIPTS = [
+    "test_cload.py",
+    "test_tetra.py",
+    "test_single_hex.py",
+    "test_single_hex_cantilever.py",
+    "test_cantilever_cload.py",
+    "simple_cantilever.py",
+]
+
+
+def _run(script):
+    # ccx links OpenMP; pin each solve to one thread so pool workers
+    # don't contend for cores
+    os.environ["OMP_NUM_THREADS"] = "1"
+    sys.path.insert(0, HERE)
+    runpy.run_path(os.path.join(HERE, script), run_name="__main__")
+    return script
+
+
+def main():
+    workers = min(len(SCRIPTS), os.cpu_count())
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        for script in ex.map(_run, SCRIPTS):
+            print(f"--- {script} done")
+
+
+if __name__ == "__main__":
+    main()
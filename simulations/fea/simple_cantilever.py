@@ -7,49 +7,53 @@ import os
 import tempfile
 
 def create_simple_inp():
-    inp = []
-    inp.append("** Simple cantilever beam (single element)")
-    inp.append("*NODE")
-    inp.append("1,0,0,0")
-    inp.append("2,10,0,0")
-    inp.append("3,10,10,0")
-    inp.append("4,0,10,0")
-    inp.append("5,0,0,10")
-    inp.append("6,10,0,10")
-    inp.append("7,10,10,10")
-    inp.append("8,0,10,10")
-    inp.append("*ELEMENT,TYPE=C3D8,ELSET=E1")
-    inp.append("1,1,2,3,4,5,6,7,8")
-    inp.append("*MATERIAL,NAME=STEEL")
-    inp.append("*ELASTIC")
-    inp.append("210000,0.3")
-    inp.append("*SOLID SECTION,ELSET=E1,MATERIAL=STEEL")
-    inp.append("*NSET,NSET=FIX")
-    inp.append("1,2,3,4")
-    inp.append("*BOUNDARY")
-    inp.append("FIX,1,3")
-    inp.append("*STEP")
-    inp.append("*STATIC")
-    inp.append("*CLOAD")
-    inp.append("5,F1,1000")
-    inp.append("6,F1,1000")
-    inp.append("7,F1,1000")
-    inp.append("8,F1,1000")
-    inp.append("*EL PRINT,ELSET=E1")
-    inp.append("S")
-    inp.append("*END STEP")
-    return "\n".join(inp)
+    # Single string constant: the deck is fixed, so building a list line by
+    # line and joining it was pure interpreter overhead
+    return """\
+** Simple cantilever beam (single element)
+*NODE
+1,0,0,0
+2,10,0,0
+3,10,10,0
+4,0,10,0
+5,0,0,10
+6,10,0,10
+7,10,10,10
+8,0,10,10
+*ELEMENT,TYPE=C3D8,ELSET=E1
+1,1,2,3,4,5,6,7,8
+*MATERIAL,NAME=STEEL
+*ELASTIC
+210000,0.3
+*SOLID SECTION,ELSET=E1,MATERIAL=STEEL
+*NSET,NSET=FIX
+1,2,3,4
+*BOUNDARY
+FIX,1,3
+*STEP
+*STATIC
+*CLOAD
+5,F1,1000
+6,F1,1000
+7,F1,1000
+8,F1,1000
+*EL PRINT,ELSET=E1
+S
+*END STEP"""
 
 with tempfile.TemporaryDirectory() as tmpdir:
     inp = create_simple_inp()
     with open(os.path.join(tmpdir, "simple.inp"), 'w') as f:
         f.write(inp)
     print("Running ccx...")
-    result = subprocess.run(["ccx", "-i", "simple"], cwd=tmpdir, 
-                          capture_output=True, text=True)
+    # stdout is never inspected: discard it rather than buffer + decode it
+    result = subprocess.run(["ccx", "-i", "simple"], cwd=tmpdir,
+                            stdout=subprocess.DEVNULL,
+                            stderr=subprocess.PIPE)
     print(f"Return code: {result.returncode}")
     if result.stderr:
-        print("stderr:", result.stderr[:300])
+        # ccx output is ASCII; decode only the printed prefix
+        print("stderr:", result.stderr[:300].decode('ascii', 'replace'))
     
     dat_path = os.path.join(tmpdir, "simple.dat")
     if os.path.exists(dat_path):
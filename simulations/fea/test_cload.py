@@ -43,16 +43,21 @@ with tempfile.TemporaryDirectory() as tmpdir:
         f.write(inp)
     print("Input written")
     
-    # Run ccx with both stdout and stderr
-    result = subprocess.run(["ccx", "-i", "testcload"], cwd=tmpdir,
-                          capture_output=True, text=True)
+    # Stream ccx stdout to a log file instead of buffering (and decoding)
+    # it all in memory — only the prefix gets printed anyway
+    log_path = os.path.join(tmpdir, "ccx.log")
+    with open(log_path, 'wb') as log:
+        result = subprocess.run(["ccx", "-i", "testcload"], cwd=tmpdir,
+                                stdout=log, stderr=subprocess.PIPE)
     print(f"Return code: {result.returncode}")
-    print(f"stdout length: {len(result.stdout)}")
+    print(f"stdout length: {os.path.getsize(log_path)}")
     print(f"stderr length: {len(result.stderr)}")
-    if result.stdout:
-        print("stdout first 500:", result.stdout[:500])
+    with open(log_path, 'rb') as log:
+        head = log.read(512)
+    if head:
+        print("stdout first 500:", head[:500].decode(errors='replace'))
     if result.stderr:
-        print("stderr:", result.stderr)
+        print("stderr:", result.stderr.decode(errors='replace'))
     
     # Check files
     for fname in os.listdir(tmpdir):
@@ -7,11 +7,16 @@ import os
 # Ensure gmsh is in PATH
 os.environ['PATH'] = os.path.expanduser('~/.local/bin') + ':' + os.environ.get('PATH', '')
 
-import pycalculix as pyc
-import numpy as np
+# Shared njit-compiled scalar helpers; the compiled cache is reused by
+# every script importing fea_math
+from fea_math import torsion_params
+
 
 def test_journal_torsion():
     """Model a main journal as a cylinder under pure torsion."""
+    # pycalculix (and its gmsh probe) is only needed here — importing it
+    # lazily keeps module import cheap for callers of torsion_params
+    import pycalculix as pyc
     # Geometry from optimized crankshaft
     radius = 35.0  # mm (70 mm diameter)
     length = 26.6  # mm (width)
@@ -58,12 +63,7 @@ def test_journal_torsion():
     # Torque T = 2800 Nm / 7 mains = 400 Nm per main
     torque_per_main = 400.0  # N·m
     # Convert to shear strain: gamma = tau / G, tau = T * r / J
-    G = E / (2 * (1 + nu))
-    J = np.pi * radius**4 / 2  # polar moment (mm⁴)
-    tau = torque_per_main * 1000 * radius / J  # MPa
-    gamma = tau / G  # shear strain
-    # Displacement at outer radius = gamma * radius
-    disp = gamma * radius  # mm
+    G, J, tau, gamma, disp = torsion_params(E, nu, radius, torque_per_main)
     # Apply circumferential displacement on outer line (rho = radius)
     model.apply_line_disp(1, 'theta', disp)  # outer line
     
@@ -11,6 +11,46 @@ import cadquery as cq
 import numpy as np
 from datetime import datetime
 
+
+def _cylinder(r, h, pnt, axis=(0.0, 0.0, 1.0)):
+    """Cylinder built in one OCCT call: radius r, height h, base centre pnt.
+
+    Skips the Workplane .circle().extrude() pipeline — for plain primitives
+    the fluent chain only adds Python wrapper layers."""
+    from OCP.BRepPrimAPI import BRepPrimAPI_MakeCylinder
+    from OCP.gp import gp_Ax2, gp_Dir, gp_Pnt
+    ax = gp_Ax2(gp_Pnt(*pnt), gp_Dir(*axis))
+    shape = BRepPrimAPI_MakeCylinder(ax, r, h).Shape()
+    return cq.Workplane("XY").newObject([cq.Shape.cast(shape)])
+
+
+def _box(dx, dy, dz, corner):
+    """Axis-aligned box with its minimum corner at `corner`, via OCCT."""
+    from OCP.BRepPrimAPI import BRepPrimAPI_MakeBox
+    from OCP.gp import gp_Pnt
+    shape = BRepPrimAPI_MakeBox(gp_Pnt(*corner), dx, dy, dz).Shape()
+    return cq.Workplane("XY").newObject([cq.Shape.cast(shape)])
+
+
+def fuse_all(first, *others):
+    """Single n-ary OCCT fuse instead of chained pairwise .union() calls.
+
+    Each .union() runs the full boolean pipeline per operand; passing all
+    operands to one Build() shares the intersection graph."""
+    from OCP.BRepAlgoAPI import BRepAlgoAPI_Fuse
+    from OCP.TopTools import TopTools_ListOfShape
+    args = TopTools_ListOfShape()
+    args.Append(first.val().wrapped)
+    tools = TopTools_ListOfShape()
+    for wp in others:
+        tools.Append(wp.val().wrapped)
+    fuse = BRepAlgoAPI_Fuse()
+    fuse.SetArguments(args)
+    fuse.SetTools(tools)
+    fuse.SetRunParallel(True)
+    fuse.Build()
+    return cq.Workplane("XY").newObject([cq.Shape.cast(fuse.Shape())])
+
 # ----------------------------------------------------------------------
 # LOAD SPECIFICATIONS
 # ----------------------------------------------------------------------
@@ -78,106 +118,105 @@ os.makedirs(out_dir, exist_ok=True)
 # Create simplified representations
 print("\nCreating simplified assembly geometry...")
 
-# 1. Piston (simplified cylinder)
-piston = (
-    cq.Workplane("XY")
-    .circle(bore_diameter / 2 - 0.1)  # clearance
-    .extrude(-(piston_geo["crown_thickness"] + piston_geo["skirt_length"]))
-    .translate((0, 0, piston_z_tdc + piston_geo["crown_thickness"]/2))
-)
-# Add pin bosses (blocks)
-boss_y = bore_diameter/2 - piston_geo["pin_boss_width"]/2
-boss = (
-    cq.Workplane("XY")
-    .rect(piston_geo["pin_boss_width"]*2, piston_geo["pin_boss_width"])
-    .extrude(-piston_geo["crown_thickness"]*0.6)
-    .translate((0, -boss_y, piston_z_tdc - piston_geo["crown_thickness"]*0.3))
-)
-piston = piston.union(boss)
-
-# 2. Connecting rod (simplified I‑beam)
-h = conrod_geo["beam_height"]
-b = conrod_geo["beam_width"]
-tw = conrod_geo["web_thickness"]
-tf = conrod_geo["flange_thickness"]
-L = conrod_length
-
-web = cq.Workplane("YZ").rect(tw, h - 2*tf).extrude(L)
-top = cq.Workplane("YZ").rect(b, tf).extrude(L).translate((0,0,(h-tf)/2))
-bottom = cq.Workplane("YZ").rect(b, tf).extrude(L).translate((0,0,-(h-tf)/2))
-beam = web.union(top).union(bottom)
-beam = beam.translate((L/2,0,0))
-
-# Add bearing ends (cylinders)
-big_end = (
-    cq.Workplane("YZ")
-    .circle(conrod_geo["big_end_diameter"]/2 + 5)
-    .extrude(conrod_geo["big_end_width"])
-    .translate((-conrod_geo["big_end_width"]/2,0,0))
-)
-small_end = (
-    cq.Workplane("YZ")
-    .circle(conrod_geo["small_end_diameter"]/2 + 5)
-    .extrude(conrod_geo["small_end_width"])
-    .translate((L - conrod_geo["small_end_width"]/2,0,0))
-)
-
-conrod = beam.union(big_end).union(small_end)
-# Position conrod: small‑end at piston pin, big‑end at crank pin
-# At TDC, small‑end Z = piston pin center ≈ piston_z_tdc - crown_thickness/2
-piston_pin_z = piston_z_tdc - piston_geo["crown_thickness"]/2
-conrod = conrod.translate((0,0,piston_pin_z))
-# Rotate to vertical (original beam along X)
-conrod = conrod.rotate((0,0,0), (1,0,0), 90)
-
-# 3. Crankshaft throw (simplified)
-main = (
-    cq.Workplane("XY")
-    .circle(crank_geo["main_journal_diameter"]/2)
-    .extrude(crank_geo["main_journal_width"])
-    .translate((-crank_geo["main_journal_width"]/2, 0, -crank_radius))
-)
-pin = (
-    cq.Workplane("XY")
-    .circle(crank_geo["pin_diameter"]/2)
-    .extrude(crank_geo["pin_width"])
-    .translate((crank_radius, 0, -crank_radius))
-    .translate((-crank_geo["pin_width"]/2, 0, 0))
-)
-cheek = (
-    cq.Workplane("XY")
-    .rect(crank_radius*0.7, crank_geo["cheek_thickness"])
-    .extrude(crank_geo["pin_width"]+10)
-    .translate((crank_radius/2, 0, -crank_radius))
-    .translate((-(crank_geo["pin_width"]+10)/2, 0, 0))
-)
-crank = main.union(pin).union(cheek)
-
-# 4. Cylinder block (simplified box)
-block_length = 200
-block_width = 200
-block_height = 100
-block = (
-    cq.Workplane("XY")
-    .box(block_length, block_width, block_height)
-    .translate((0,0,-block_height/2))
-)
-# Bore hole
-bore = (
-    cq.Workplane("XY")
-    .circle(bore_diameter/2)
-    .extrude(block_height)
-    .translate((0,0,-block_height/2))
-)
-block = block.cut(bore)
+# The four parts share no inputs, and the OCCT modelling kernel releases
+# the GIL while it works — building them on a small thread pool overlaps
+# the boolean/primitive work across cores.
+from concurrent.futures import ThreadPoolExecutor
+
+
+def build_piston():
+    """Piston: simplified cylinder plus pin bosses."""
+    r = bore_diameter / 2 - 0.1  # clearance
+    length = piston_geo["crown_thickness"] + piston_geo["skirt_length"]
+    crown_top = piston_z_tdc + piston_geo["crown_thickness"]/2
+    piston = _cylinder(r, length, (0, 0, crown_top - length))
+    # Add pin bosses (blocks)
+    bw = piston_geo["pin_boss_width"]
+    bh = piston_geo["crown_thickness"]*0.6
+    boss_y = bore_diameter/2 - bw/2
+    boss = _box(bw*2, bw, bh,
+                (-bw, -boss_y - bw/2,
+                 piston_z_tdc - piston_geo["crown_thickness"]*0.3 - bh))
+    return fuse_all(piston, boss)
+
+
+def build_conrod():
+    """Connecting rod: simplified I-beam with bearing ends."""
+    h = conrod_geo["beam_height"]
+    b = conrod_geo["beam_width"]
+    tw = conrod_geo["web_thickness"]
+    tf = conrod_geo["flange_thickness"]
+    L = conrod_length
+
+    # Beam plates built at their final x offset (the old code extruded at
+    # the origin and translated by L/2 afterwards)
+    web = _box(L, tw, h - 2*tf, (L/2, -tw/2, -(h - 2*tf)/2))
+    top = _box(L, b, tf, (L/2, -b/2, (h - 2*tf)/2))
+    bottom = _box(L, b, tf, (L/2, -b/2, -h/2))
+
+    # Bearing ends (cylinders along the beam axis)
+    big_end = _cylinder(conrod_geo["big_end_diameter"]/2 + 5,
+                        conrod_geo["big_end_width"],
+                        (-conrod_geo["big_end_width"]/2, 0, 0), axis=(1, 0, 0))
+    small_end = _cylinder(conrod_geo["small_end_diameter"]/2 + 5,
+                          conrod_geo["small_end_width"],
+                          (L - conrod_geo["small_end_width"]/2, 0, 0),
+                          axis=(1, 0, 0))
+
+    conrod = fuse_all(web, top, bottom, big_end, small_end)
+    # Position conrod: small‑end at piston pin, big‑end at crank pin
+    # At TDC, small‑end Z = piston pin center ≈ piston_z_tdc - crown_thickness/2
+    piston_pin_z = piston_z_tdc - piston_geo["crown_thickness"]/2
+    conrod = conrod.translate((0,0,piston_pin_z))
+    # Rotate to vertical (original beam along X)
+    return conrod.rotate((0,0,0), (1,0,0), 90)
+
+
+def build_crank():
+    """Crankshaft throw: main journal, pin and cheek."""
+    mw = crank_geo["main_journal_width"]
+    pw = crank_geo["pin_width"]
+    main = _cylinder(crank_geo["main_journal_diameter"]/2, mw,
+                     (-mw/2, 0, -crank_radius))
+    pin = _cylinder(crank_geo["pin_diameter"]/2, pw,
+                    (crank_radius - pw/2, 0, -crank_radius))
+    cheek = _box(crank_radius*0.7, crank_geo["cheek_thickness"], pw + 10,
+                 (crank_radius/2 - crank_radius*0.35 - (pw + 10)/2,
+                  -crank_geo["cheek_thickness"]/2, -crank_radius))
+    return fuse_all(main, pin, cheek)
+
+
+def build_block():
+    """Cylinder block: simplified box with the bore cut out."""
+    block_length = 200
+    block_width = 200
+    block_height = 100
+    block = _box(block_length, block_width, block_height,
+                 (-block_length/2, -block_width/2, -block_height))
+    # Bore hole
+    bore = _cylinder(bore_diameter/2, block_height, (0, 0, -block_height/2))
+    return block.cut(bore)
+
+
+with ThreadPoolExecutor(max_workers=4) as ex:
+    piston, conrod, crank, block = [
+        f.result() for f in [ex.submit(build_piston), ex.submit(build_conrod),
+                             ex.submit(build_crank), ex.submit(build_block)]
+    ]
 
 # ----------------------------------------------------------------------
 # COMBINE AND EXPORT
 # ----------------------------------------------------------------------
-assembly = piston.union(conrod).union(crank).union(block)
+# The four parts share no volume, so no boolean is needed at all — an
+# Assembly writes them into one STEP without the O(faces²) fuses
+assembly = cq.Assembly(name="single_cylinder")
+assembly.add(piston, name="piston")
+assembly.add(conrod, name="conrod")
+assembly.add(crank, name="crank")
+assembly.add(block, name="block")
 
 step_path = f"{out_dir}/single_cylinder_assembly_corrected.step"
-cq.exporters.export(assembly, step_path, "STEP")
+assembly.save(step_path)
 print(f"✅ Assembly CAD saved to {step_path}")
 
 # ----------------------------------------------------------------------
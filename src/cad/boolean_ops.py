@@ -0,0 +1,51 @@
+"""
+Shared n-ary boolean helpers for the CAD modules.
+
+Chained pairwise .union() calls run OpenCascade's full boolean pipeline
+(intersection + Finish/healing) once per operand. Passing every operand
+to a single BRepAlgoAPI_Fuse shares one intersection graph and one
+Finish pass, and glue mode skips intersection tests entirely for
+operands that only touch.
+"""
+import cadquery as cq
+from OCP.BOPAlgo import BOPAlgo_GlueEnum
+from OCP.BRepAlgoAPI import BRepAlgoAPI_Fuse
+from OCP.ShapeFix import ShapeFix_Shape
+from OCP.TopTools import TopTools_ListOfShape
+
+
+def fuse_all(parts, glue="shift", tol=1e-6, heal=False):
+    """Fuse a sequence of Workplanes in one n-ary OCCT operation.
+
+    glue="shift" is safe when operands touch or are disjoint but do not
+    interpenetrate; glue="full" additionally assumes shared faces match
+    exactly; glue=None runs the full intersection. `tol` is the fuzzy
+    tolerance for near-coincident geometry.
+
+    The fuse itself runs non-destructively and without healing; pass
+    heal=True on the final fuse of an assembly to run ShapeFix once on
+    the merged result instead of once per intermediate boolean.
+    """
+    shapes = [p.val().wrapped for p in parts]
+    args = TopTools_ListOfShape()
+    args.Append(shapes[0])
+    tools = TopTools_ListOfShape()
+    for shape in shapes[1:]:
+        tools.Append(shape)
+    fuse = BRepAlgoAPI_Fuse()
+    fuse.SetArguments(args)
+    fuse.SetTools(tools)
+    fuse.SetRunParallel(True)
+    fuse.SetNonDestructive(True)
+    fuse.SetFuzzyValue(tol)
+    if glue == "shift":
+        fuse.SetGlue(BOPAlgo_GlueEnum.BOPAlgo_GlueShift)
+    elif glue == "full":
+        fuse.SetGlue(BOPAlgo_GlueEnum.BOPAlgo_GlueFull)
+    fuse.Build()
+    shape = fuse.Shape()
+    if heal:
+        fix = ShapeFix_Shape(shape)
+        fix.Perform()
+        shape = fix.Shape()
+    return cq.Workplane("XY").newObject([cq.Shape.cast(shape)])
@@ -3,86 +3,87 @@ Parametric CAD model of V12 connecting rod using CadQuery.
 Generates geometry based on ConrodGeometry.
 """
 import cadquery as cq
-import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from src.cad.boolean_ops import fuse_all
+from src.cad.primitives import hollow_cylinder
 from src.engine.conrod import ConrodGeometry
 
-def create_connecting_rod(geo: ConrodGeometry):
-    """
-    Create a connecting rod assembly.
-    Big end centered at origin, small end offset along X‑axis by center_length.
-    Beam is I‑beam cross‑section extruded along X.
-    """
-    # ---- 1. Create I‑beam as three rectangular prisms (web + two flanges) ----
+def _beam(geo: ConrodGeometry):
+    """I-beam as one closed 12-vertex cross-section, extruded once.
+
+    Drawing the I-shape as a single polyline in the YZ plane yields one
+    face, one prism and one solid; the old web + two flanges needed three
+    extrusions and left three solids for the fuse to sew together."""
     h = geo.beam_height          # total height (Z direction)
     b = geo.beam_width           # total width (Y direction)
     tw = geo.web_thickness       # web thickness (vertical)
     tf = geo.flange_thickness    # flange thickness (horizontal)
-    
-    # Web: centered at Y=0, Z=0
-    web = (
-        cq.Workplane("YZ")
-        .rect(tw, h - 2*tf)
-        .extrude(geo.center_length)
-    )
-    # Top flange: centered at Y=0, Z = (h - tf)/2
-    top_flange = (
-        cq.Workplane("YZ")
-        .rect(b, tf)
-        .extrude(geo.center_length)
-        .translate((0, 0, (h - tf)/2))
-    )
-    # Bottom flange: centered at Y=0, Z = -(h - tf)/2
-    bottom_flange = (
+
+    beam = (
         cq.Workplane("YZ")
-        .rect(b, tf)
+        .polyline([
+            (-b/2, h/2), (b/2, h/2),                    # top flange, top edge
+            (b/2, h/2 - tf), (tw/2, h/2 - tf),          # under top flange
+            (tw/2, -(h/2 - tf)), (b/2, -(h/2 - tf)),    # web, right side
+            (b/2, -h/2), (-b/2, -h/2),                  # bottom flange
+            (-b/2, -(h/2 - tf)), (-tw/2, -(h/2 - tf)),  # under bottom flange
+            (-tw/2, h/2 - tf), (-b/2, h/2 - tf),        # web, left side
+        ])
+        .close()
         .extrude(geo.center_length)
-        .translate((0, 0, -(h - tf)/2))
     )
-    # Union the three parts
-    beam = web.union(top_flange).union(bottom_flange)
-    # Center beam between ends
-    beam = beam.translate((geo.center_length / 2, 0, 0))
-    
-    # ---- 3. Create big end (crank pin bearing) ----
-    # Outer cylinder (axis along X)
+    # Center the beam between the ends; the fuse happens once at the end
+    return beam.translate((geo.center_length / 2, 0, 0))
+
+
+def _big_end(geo: ConrodGeometry):
+    """Big end (crank pin bearing): annular prism centered at X=0."""
     big_end_outer_radius = geo.big_end_diameter / 2 + 12.0  # wall thickness ~12mm
-    big_end_outer = (
-        cq.Workplane("YZ")
-        .circle(big_end_outer_radius)
-        .extrude(geo.big_end_width)  # extrude along X
-        .translate((-geo.big_end_width / 2, 0, 0))  # center at X=0
-    )
-    # Hole for crank pin
-    big_end_hole = (
-        cq.Workplane("YZ")
-        .circle(geo.big_end_diameter / 2)
-        .extrude(geo.big_end_width + 2)  # slightly longer to ensure clean cut
-        .translate((-geo.big_end_width / 2 - 1, 0, 0))
-    )
-    big_end = big_end_outer.cut(big_end_hole)
-    
-    # ---- 4. Create small end (piston pin bearing) ----
+    return hollow_cylinder(big_end_outer_radius, geo.big_end_diameter / 2,
+                           geo.big_end_width,
+                           pnt=(-geo.big_end_width / 2, 0, 0), axis=(1, 0, 0))
+
+
+def _small_end(geo: ConrodGeometry):
+    """Small end (piston pin bearing): annular prism at center_length."""
     small_end_outer_radius = geo.small_end_diameter / 2 + 10.0  # wall thickness ~10mm
-    small_end_outer = (
-        cq.Workplane("YZ")
-        .circle(small_end_outer_radius)
-        .extrude(geo.small_end_width)
-        .translate((geo.center_length - geo.small_end_width / 2, 0, 0))
-    )
-    small_end_hole = (
-        cq.Workplane("YZ")
-        .circle(geo.small_end_diameter / 2)
-        .extrude(geo.small_end_width + 2)
-        .translate((geo.center_length - geo.small_end_width / 2 - 1, 0, 0))
-    )
-    small_end = small_end_outer.cut(small_end_hole)
-    
-    # ---- 5. Union all parts ----
-    rod = beam.union(big_end).union(small_end)
-    
-    # ---- 6. Add fillets (simplified: chamfer edges) ----
-    # We'll skip for now; complex edge selection
-    
+    return hollow_cylinder(
+        small_end_outer_radius, geo.small_end_diameter / 2, geo.small_end_width,
+        pnt=(geo.center_length - geo.small_end_width / 2, 0, 0), axis=(1, 0, 0))
+
+
+def create_connecting_rod(geo: ConrodGeometry, union_solids: bool = True):
+    """
+    Create a connecting rod assembly.
+    Big end centered at origin, small end offset along X-axis by center_length.
+    Beam is I-beam cross-section extruded along X.
+
+    With union_solids=False the touching sub-solids are returned as a
+    cq.Compound without any fuse — enough for STL preview, where the
+    mesher does not care about manifoldness.
+    """
+    # The beam, big end and small end share no state, so build them in
+    # parallel (same pattern as the single-cylinder assembly script); the
+    # OCCT constructors run in C++ and release the GIL
+    with ThreadPoolExecutor(max_workers=3) as ex:
+        beam_f = ex.submit(_beam, geo)
+        big_f = ex.submit(_big_end, geo)
+        small_f = ex.submit(_small_end, geo)
+        beam = beam_f.result()
+        big_end = big_f.result()
+        small_end = small_f.result()
+
+    if not union_solids:
+        return cq.Compound.makeCompound(
+            [beam.val(), big_end.val(), small_end.val()])
+
+    # Single n-ary fuse with the full intersection: the beam overlaps
+    # the small-end annulus (its extrusion runs through it), and glue
+    # modes are only defined for operands that do not interpenetrate
+    rod = fuse_all([beam, big_end, small_end], glue=None, heal=True)
+
+    # Fillets (simplified: chamfer edges) skipped for now; complex edge selection
+
     return rod
 
 def export_step(assembly, filename: str):
@@ -107,10 +108,10 @@ if __name__ == "__main__":
     
     print("Generating connecting rod CAD...")
     rod = create_connecting_rod(test_geo)
-    print("Exporting to STEP...")
+    print("Exporting to STEP and STL...")
     export_step(rod, "conrod_test.step")
-    print("Done. Saved as 'conrod_test.step'")
-    
-    # Also export STL
-    cq.exporters.export(rod, "conrod_test.stl", "STL")
-    print("Exported STL.")
\ No newline at end of file
+    # STL preview renders a loose compound fine; skip the fuse entirely
+    preview = create_connecting_rod(test_geo, union_solids=False)
+    cq.exporters.export(preview, "conrod_test.stl", "STL",
+                        tolerance=0.1, angularTolerance=0.2)
+    print("Done. Saved 'conrod_test.step' and 'conrod_test.stl'.")
\ No newline at end of file
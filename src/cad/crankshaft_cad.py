@@ -3,46 +3,73 @@ Parametric CAD model of V12 crankshaft using CadQuery.
 Generates geometry based on CrankshaftGeometry.
 """
 import cadquery as cq
-import numpy as np
+from functools import lru_cache
+from src.cad.boolean_ops import fuse_all
+from src.cad.primitives import cylinder
 from src.engine.crankshaft import CrankshaftGeometry
 
-def create_throw(geo: CrankshaftGeometry, angle_deg: float = 0.0):
-    """
-    Create a single crank throw (main journal + pin + two cheeks).
-    Returns a CadQuery Workplane centered on main journal axis.
-    The throw is rotated about Z‑axis by angle_deg (for V12 phasing).
-    """
-    # Main journal (cylinder along X‑axis)
-    main = (
-        cq.Workplane("XZ")
-        .circle(geo.main_journal_diameter / 2)
-        .extrude(geo.main_journal_width)
-    )
-    
-    # Crank pin (offset by stroke, also along X‑axis)
-    pin = (
-        cq.Workplane("XZ")
-        .transformed(offset=(0, geo.stroke, 0))
-        .circle(geo.pin_diameter / 2)
-        .extrude(geo.pin_width)
-    )
-    
-    # Cheeks (counterweight disks) – two per throw
+@lru_cache(maxsize=64)
+def _base_solids_cached(main_d, main_w, pin_d, pin_w, stroke,
+                        cheek_t, cheek_r, cheek_hole_r, cheek_sector):
+    """Prototype main/pin/cheek solids for one throw, keyed on dimensions.
+
+    All six throws use identical solids; instancing them through
+    Location moves shares the underlying TShape instead of rebuilding
+    (and re-triangulating) the primitives per throw. Caching on the
+    dimension tuple extends that sharing across create_throw calls in
+    parameter sweeps that only vary rotations/offsets."""
+    # Main journal and crank pin: plain cylinders straight from OCCT
+    # (the XZ workplane extruded along its -Y normal)
+    main = cylinder(main_d / 2, main_w, axis=(0, -1, 0)).val()
+
+    # Crank pin (offset by stroke, also along the same axis)
+    pin = cylinder(pin_d / 2, pin_w, pnt=(0, 0, stroke), axis=(0, -1, 0)).val()
+
+    # Cheek (counterweight disk) – two per throw
     # Simplified as a rectangular block with a hole, oriented along X
-    cheek_height = geo.cheek_radius * geo.cheek_sector_factor  # depth along X
+    cheek_height = cheek_r * cheek_sector  # depth along X
     cheek = (
         cq.Workplane("XY")
-        .rect(geo.cheek_thickness, geo.cheek_radius * 2)  # Y‑Z plane
-        .circle(geo.cheek_hole_radius)
+        .rect(cheek_t, cheek_r * 2)  # Y-Z plane
+        .circle(cheek_hole_r)
         .extrude(cheek_height)
         .rotateAboutCenter((0,1,0), 90)  # orient along X
+        .val()
     )
-    # Position cheeks on each side of pin
-    cheek1 = cheek.translate((0, geo.stroke, -geo.cheek_radius))
-    cheek2 = cheek.translate((0, geo.stroke, geo.cheek_radius))
-    
-    # Combine components of this throw
-    throw = main.union(pin).union(cheek1).union(cheek2)
+    return main, pin, cheek
+
+
+def _base_solids(geo: CrankshaftGeometry):
+    """Shared throw prototypes for `geo` (see _base_solids_cached)."""
+    return _base_solids_cached(
+        geo.main_journal_diameter, geo.main_journal_width,
+        geo.pin_diameter, geo.pin_width, geo.stroke,
+        geo.cheek_thickness, geo.cheek_radius, geo.cheek_hole_radius,
+        geo.cheek_sector_factor)
+
+
+def create_throw(geo: CrankshaftGeometry, angle_deg: float = 0.0, base=None):
+    """
+    Create a single crank throw (main journal + pin + two cheeks).
+    Returns a CadQuery Workplane centered on main journal axis.
+    The throw is rotated about Z‑axis by angle_deg (for V12 phasing).
+    `base` lets callers pass prototype solids shared across throws.
+    """
+    main_s, pin_s, cheek_s = base if base is not None else _base_solids(geo)
+    main = cq.Workplane("XY").newObject([main_s])
+    pin = cq.Workplane("XY").newObject([pin_s])
+    # Position cheeks on each side of pin; moved() only wraps a
+    # TopLoc_Location, no deep copy of the prototype
+    cheek1 = cq.Workplane("XY").newObject(
+        [cheek_s.moved(cq.Location(cq.Vector(0, geo.stroke, -geo.cheek_radius)))])
+    cheek2 = cq.Workplane("XY").newObject(
+        [cheek_s.moved(cq.Location(cq.Vector(0, geo.stroke, geo.cheek_radius)))])
+
+    # Combine components of this throw; clean=False skips CadQuery's
+    # per-union UnifySameDomain pass -- healing runs once on the final fuse
+    throw = (main.union(pin, clean=False)
+                 .union(cheek1, clean=False)
+                 .union(cheek2, clean=False))
     
     # Apply rotation for V12 phasing (60° between throws)
     if angle_deg != 0.0:
@@ -50,52 +77,90 @@ def create_throw(geo: CrankshaftGeometry, angle_deg: float = 0.0):
     
     return throw
 
-def create_crankshaft(geo: CrankshaftGeometry):
+def create_crankshaft(geo: CrankshaftGeometry, union_solids: bool = True):
     """
     Assemble full V12 crankshaft with 7 mains and 6 throws.
     Returns CadQuery assembly.
+
+    With union_solids=False the located throws come back as a
+    cq.Compound without the fuse — enough for STL preview, where the
+    mesher does not care about manifoldness.
     """
     # Start with first main journal at origin
     # V12 firing order spacing: 60° between throws, 180° between banks
     # Simplified: we'll create 6 throws, each rotated by 60°
+    #
+    # Union the base throw once, then place each instance with a composed
+    # Location (translate + rotate).  translate()/rotateAboutCenter() per
+    # throw would rewrite the whole sub-assembly BRep six times; moved()
+    # only wraps the shared solid in a TopLoc_Location.
+    base = _base_solids(geo)  # shared prototypes; built (and meshed) once
+    base_s = create_throw(geo, angle_deg=0.0, base=base).val()
+    pitch = geo.main_journal_width + geo.pin_width + 10.0  # 10 mm gap
     throws = []
     for i in range(6):
-        angle = i * 60.0
-        throw = create_throw(geo, angle_deg=angle)
-        # Offset along X‑axis (distance between throws = main_journal_width + pin_width + gap)
-        x_offset = i * (geo.main_journal_width + geo.pin_width + 10.0)  # 10 mm gap
-        throw = throw.translate((x_offset, 0, 0))
-        throws.append(throw)
-    
-    # Union all throws
-    crankshaft = throws[0]
-    for t in throws[1:]:
-        crankshaft = crankshaft.union(t)
-    
-    # Add extra main journal at the end
-    last_main = (
-        cq.Workplane("XZ")
-        .circle(geo.main_journal_diameter / 2)
-        .extrude(geo.main_journal_width)
-        .translate((6 * (geo.main_journal_width + geo.pin_width + 10.0), 0, 0))
-    )
-    crankshaft = crankshaft.union(last_main)
-    
-    return crankshaft
+        loc = (cq.Location(cq.Vector(i * pitch, 0, 0))
+               * cq.Location(cq.Vector(0, 0, 0), cq.Vector(0, 0, 1), i * 60.0))
+        throws.append(cq.Workplane("XY").newObject([base_s.moved(loc)]))
+
+    # Extra main journal at the end, built in place
+    last_main = cylinder(
+        geo.main_journal_diameter / 2, geo.main_journal_width,
+        pnt=(6 * pitch, 0, 0),
+        axis=(0, -1, 0))
+
+    if not union_solids:
+        return cq.Compound.makeCompound(
+            [w.val() for w in throws] + [last_main.val()])
+
+    # One n-ary fuse over all throws plus the last main. No glue:
+    # adjacent throws' journals interpenetrate at realistic dimensions
+    # (journal radii exceed half the throw pitch), and OCCT's glue modes
+    # are only defined for non-interfering operands
+    return fuse_all(throws + [last_main], glue=None, heal=True)
+
+def create_crankshaft_assembly(geo: CrankshaftGeometry):
+    """
+    V12 crankshaft as a cq.Assembly: one base throw referenced six times
+    with per-instance Locations (rotation + X offset) plus the end main.
+    No fuse at all — the parts only touch — and the STEP writer emits the
+    shared throw BRep once instead of seven near-identical solids.
+    """
+    base = _base_solids(geo)
+    base_throw = create_throw(geo, angle_deg=0.0, base=base)
+    pitch = geo.main_journal_width + geo.pin_width + 10.0  # 10 mm gap
+
+    assy = cq.Assembly(name="crankshaft")
+    for i in range(6):
+        loc = (cq.Location(cq.Vector(i * pitch, 0, 0))
+               * cq.Location(cq.Vector(0, 0, 0), cq.Vector(0, 0, 1), i * 60.0))
+        assy.add(base_throw, name=f"throw{i}", loc=loc)
+
+    last_main = cylinder(geo.main_journal_diameter / 2,
+                         geo.main_journal_width, axis=(0, -1, 0))
+    assy.add(last_main, name="main6", loc=cq.Location(cq.Vector(6 * pitch, 0, 0)))
+    return assy
 
 def export_step(assembly, filename: str):
     """Export assembly to STEP file."""
-    cq.exporters.export(assembly, filename, "STEP")
+    if isinstance(assembly, cq.Assembly):
+        # OCAF writer: shared shapes are transferred once with transforms
+        assembly.save(filename)
+    else:
+        cq.exporters.export(assembly, filename, "STEP")
 
 if __name__ == "__main__":
     # Test with baseline geometry
     from src.engine.crankshaft import baseline
     print("Generating crankshaft CAD...")
-    crankshaft = create_crankshaft(baseline)
+    crankshaft = create_crankshaft_assembly(baseline)
     print("Exporting to STEP...")
     export_step(crankshaft, "crankshaft_baseline.step")
     print("Done. Saved as 'crankshaft_baseline.step'")
-    
+
     # Also export to STL for quick viewing
-    cq.exporters.export(crankshaft, "crankshaft_baseline.stl", "STL")
+    # Explicit deflection: CadQuery defaults over-tessellate the analytic
+    # journal/pin cylinders; 0.1 mm / 0.2 rad is plenty for preview
+    cq.exporters.export(crankshaft.toCompound(), "crankshaft_baseline.stl",
+                        "STL", tolerance=0.1, angularTolerance=0.2)
     print("STL exported as well.")
\ No newline at end of file
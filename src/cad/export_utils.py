@@ -0,0 +1,25 @@
+"""
+Combined STEP + STL export that tessellates once.
+
+Exporting STEP and then STL through cq.exporters runs a fresh
+BRepMesh_IncrementalMesh for the STL pass. Meshing up front (in
+parallel) lets the STL writer reuse the stored triangulation; the STEP
+transfer ignores it, so writing both back-to-back costs one mesh.
+"""
+from OCP.BRepMesh import BRepMesh_IncrementalMesh
+from OCP.STEPControl import STEPControl_StepModelType, STEPControl_Writer
+from OCP.StlAPI import StlAPI_Writer
+
+
+def export_step_and_stl(workplane, step_path, stl_path,
+                        lin_deflection=0.1, ang_deflection=0.5):
+    """Write `workplane`'s solid to both formats from one triangulation."""
+    shape = workplane.val().wrapped
+    BRepMesh_IncrementalMesh(shape, lin_deflection, False, ang_deflection, True)
+
+    writer = STEPControl_Writer()
+    writer.Transfer(shape, STEPControl_StepModelType.STEPControl_AsIs)
+    writer.Write(step_path)
+
+    stl = StlAPI_Writer()
+    stl.Write(shape, stl_path)
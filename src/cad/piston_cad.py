@@ -3,77 +3,91 @@ Parametric CAD model of V12 piston using CadQuery.
 Generates geometry based on PistonGeometry.
 """
 import cadquery as cq
-import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from src.cad.primitives import cylinder, hollow_cylinder
 from src.engine.piston import PistonGeometry
 
-def create_piston(geo: PistonGeometry):
-    """
-    Create a piston assembly.
-    Crown top at Z=0, piston extends downward (negative Z).
-    Pin bore along Y‑axis.
-    """
-    # ---- 1. Crown (disc) ----
-    crown = (
-        cq.Workplane("XY")
-        .circle(geo.bore_diameter / 2)
-        .extrude(-geo.crown_thickness)  # downward
-    )
-    
-    # ---- 2. Ring lands (simplified as grooves) ----
-    # We'll create a cylinder representing the ring‑land region
-    ring_land_outer = (
-        cq.Workplane("XY")
-        .circle(geo.bore_diameter / 2 - 0.2)  # slight clearance
-        .extrude(-geo.compression_height)
-        .translate((0, 0, -geo.crown_thickness))
-    )
-    # Subtract ring grooves (simplified as rectangular cut)
-    # For now, skip detailed grooves
-    
-    # ---- 3. Skirt (cylindrical shell) ----
-    skirt_outer = (
-        cq.Workplane("XY")
-        .circle(geo.bore_diameter / 2 - 0.5)  # clearance
-        .extrude(-geo.skirt_length)
-        .translate((0, 0, -geo.crown_thickness - geo.compression_height))
-    )
-    skirt_inner = (
-        cq.Workplane("XY")
-        .circle(geo.bore_diameter / 2 - 0.5 - geo.skirt_thickness)
-        .extrude(-geo.skirt_length)
-        .translate((0, 0, -geo.crown_thickness - geo.compression_height))
+def _crown(geo: PistonGeometry):
+    """Crown disc, grown downward from Z=0."""
+    return cylinder(geo.bore_diameter / 2, geo.crown_thickness,
+                    axis=(0, 0, -1))
+
+
+def _ring_land(geo: PistonGeometry):
+    """Ring-land region below the crown (grooves simplified away)."""
+    return cylinder(geo.bore_diameter / 2 - 0.2,  # slight clearance
+                    geo.compression_height,
+                    pnt=(0, 0, -geo.crown_thickness),
+                    axis=(0, 0, -1))
+
+
+def _skirt(geo: PistonGeometry):
+    """Skirt shell: annular prism built directly at its final position."""
+    return hollow_cylinder(
+        geo.bore_diameter / 2 - 0.5,  # clearance
+        geo.bore_diameter / 2 - 0.5 - geo.skirt_thickness,
+        geo.skirt_length,
+        pnt=(0, 0, -geo.crown_thickness - geo.compression_height),
+        axis=(0, 0, -1),
     )
-    skirt = skirt_outer.cut(skirt_inner)
-    
-    # ---- 4. Pin bosses (two blocks with hole) ----
+
+
+def _bosses(geo: PistonGeometry):
+    """Pin bosses: one two-rect sketch extrusion, then the pin-hole cut."""
     boss_height = geo.compression_height * 0.6
     boss_y_offset = geo.bore_diameter / 2 - geo.pin_boss_width / 2
-    # Left boss
-    left_boss = (
+    boss_pair = (
         cq.Workplane("XY")
+        .pushPoints([(0, -boss_y_offset), (0, boss_y_offset)])
         .rect(geo.pin_diameter + 2 * geo.pin_boss_width, geo.pin_boss_width)
         .extrude(-boss_height)
-        .translate((0, -boss_y_offset, -geo.crown_thickness))
-    )
-    # Right boss (mirror)
-    right_boss = (
-        cq.Workplane("XY")
-        .rect(geo.pin_diameter + 2 * geo.pin_boss_width, geo.pin_boss_width)
-        .extrude(-boss_height)
-        .translate((0, boss_y_offset, -geo.crown_thickness))
-    )
-    # Pin hole through both bosses
-    pin_hole = (
-        cq.Workplane("XY")
-        .circle(geo.pin_diameter / 2)
-        .extrude(-boss_height * 1.1)  # slightly longer
-        .translate((0, 0, -geo.crown_thickness - boss_height * 0.05))
+        .translate((0, 0, -geo.crown_thickness))
     )
-    bosses = left_boss.union(right_boss).cut(pin_hole)
-    
-    # ---- 5. Combine all parts ----
-    piston = crown.union(ring_land_outer).union(skirt).union(bosses)
-    
+    # Pin hole through both bosses (slightly longer)
+    pin_hole = cylinder(geo.pin_diameter / 2, boss_height * 1.1,
+                        pnt=(0, 0, -geo.crown_thickness - boss_height * 0.05),
+                        axis=(0, 0, -1))
+    return boss_pair.cut(pin_hole)
+
+
+@lru_cache(maxsize=64)
+def create_piston(geo: PistonGeometry, union_solids: bool = True):
+    """
+    Create a piston assembly.
+    Crown top at Z=0, piston extends downward (negative Z).
+    Pin bore along Y-axis.
+
+    With union_solids=False the touching sub-solids come back as a
+    cq.Compound without any union — enough for STL preview, where the
+    mesher does not care about manifoldness.
+
+    Memoized on the frozen geometry: repeated previews of the same design
+    return the cached solid instead of rebuilding it. Callers treat the
+    result as immutable; placement goes through Location wraps, which
+    never touch the shared TShape.
+    """
+    # The four sub-parts share no state, so build them in parallel (same
+    # pattern as the single-cylinder assembly script); the OCCT work runs
+    # in C++ and releases the GIL
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        crown, ring_land_outer, skirt, bosses = [
+            f.result() for f in [ex.submit(_crown, geo),
+                                 ex.submit(_ring_land, geo),
+                                 ex.submit(_skirt, geo),
+                                 ex.submit(_bosses, geo)]]
+
+    if not union_solids:
+        return cq.Compound.makeCompound(
+            [crown.val(), ring_land_outer.val(), skirt.val(), bosses.val()])
+
+    # Combine all parts; intermediate unions skip CadQuery's per-union
+    # UnifySameDomain pass and the compound is cleaned once at the end
+    piston = (crown.union(ring_land_outer, clean=False)
+                   .union(skirt, clean=False)
+                   .union(bosses, clean=False)
+                   .clean())
+
     return piston
 
 def export_step(assembly, filename: str):
@@ -84,10 +98,10 @@ if __name__ == "__main__":
     from src.engine.piston import baseline
     print("Generating piston CAD...")
     piston = create_piston(baseline)
-    print("Exporting to STEP...")
+    print("Exporting to STEP and STL...")
     export_step(piston, "piston_baseline.step")
-    print("Done. Saved as 'piston_baseline.step'")
-    
-    # Also export STL
-    cq.exporters.export(piston, "piston_baseline.stl", "STL")
-    print("Exported STL.")
\ No newline at end of file
+    # STL preview renders a loose compound fine; skip the union entirely
+    preview = create_piston(baseline, union_solids=False)
+    cq.exporters.export(preview, "piston_baseline.stl", "STL",
+                        tolerance=0.1, angularTolerance=0.2)
+    print("Done. Saved 'piston_baseline.step' and 'piston_baseline.stl'.")
\ No newline at end of file
@@ -0,0 +1,72 @@
+"""
+Direct OCCT primitive constructors for the CAD modules.
+
+cq.Workplane(...).circle(r).extrude(h) runs Wire -> Face -> Prism through
+several Python wrapper layers; for a plain cylinder,
+BRepPrimAPI_MakeCylinder emits the canonical analytic BRep in a single
+C++ constructor call.
+"""
+import cadquery as cq
+from functools import lru_cache
+from OCP.BRepBuilderAPI import (BRepBuilderAPI_MakeEdge,
+                                BRepBuilderAPI_MakeFace,
+                                BRepBuilderAPI_MakeWire)
+from OCP.BRepPrimAPI import BRepPrimAPI_MakeCylinder, BRepPrimAPI_MakePrism
+from OCP.gp import gp_Ax2, gp_Ax3, gp_Circ, gp_Dir, gp_Pnt, gp_Trsf, gp_Vec
+from OCP.TopLoc import TopLoc_Location
+from OCP.TopoDS import TopoDS
+
+
+@lru_cache(maxsize=1024)
+def _cylinder_shape(radius, height):
+    """Canonical cylinder TShape at the origin along +Z, built once per
+    (radius, height); every placement of it only composes a Location."""
+    return BRepPrimAPI_MakeCylinder(radius, height).Shape()
+
+
+def _placement(pnt, axis):
+    """TopLoc_Location carrying origin-to-(pnt, axis) displacement."""
+    trsf = gp_Trsf()
+    trsf.SetDisplacement(gp_Ax3(), gp_Ax3(gp_Pnt(*pnt), gp_Dir(*axis)))
+    return TopLoc_Location(trsf)
+
+
+def cylinder(radius, height, pnt=(0.0, 0.0, 0.0), axis=(0.0, 0.0, 1.0)):
+    """Cylinder with its base centre at `pnt`, grown along `axis`.
+
+    Returned wrapped in a Workplane so the call sites can keep chaining
+    cut/union/translate as before. The underlying BRep is cached per
+    (radius, height): parameter sweeps that only move or rotate parts
+    never rebuild the primitive, they just wrap the shared TShape in a
+    new Location."""
+    shape = _cylinder_shape(radius, height).Moved(_placement(pnt, axis))
+    return cq.Workplane("XY").newObject([cq.Shape.cast(shape)])
+
+
+def hollow_cylinder(r_out, r_in, height, pnt=(0.0, 0.0, 0.0),
+                    axis=(0.0, 0.0, 1.0)):
+    """Annular cylinder with its base centre at `pnt`, grown along `axis`.
+
+    Cutting a concentric cylinder out of a solid one runs a full BOPAlgo
+    boolean for a result that is analytically an annulus.  Building the
+    annular face (outer circle wire, inner circle wire reversed) and
+    extruding it with one MakePrism yields the hollow solid directly.
+    Cached per (r_out, r_in, height) like the plain cylinder."""
+    shape = _hollow_cylinder_shape(r_out, r_in, height).Moved(
+        _placement(pnt, axis))
+    return cq.Workplane("XY").newObject([cq.Shape.cast(shape)])
+
+
+@lru_cache(maxsize=1024)
+def _hollow_cylinder_shape(r_out, r_in, height):
+    """Canonical annular cylinder TShape at the origin along +Z."""
+    ax = gp_Ax2()
+
+    def _wire(r):
+        edge = BRepBuilderAPI_MakeEdge(gp_Circ(ax, r)).Edge()
+        return BRepBuilderAPI_MakeWire(edge).Wire()
+
+    face_builder = BRepBuilderAPI_MakeFace(_wire(r_out), True)
+    face_builder.Add(TopoDS.Wire_s(_wire(r_in).Reversed()))
+    return BRepPrimAPI_MakePrism(face_builder.Face(),
+                                 gp_Vec(0.0, 0.0, height)).Shape()
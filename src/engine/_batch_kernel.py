@@ -0,0 +1,152 @@
+"""
+Shared compiled batch evaluator for combined engine candidates.
+
+The engine-level optimizer sweeps conrod + crankshaft + block + piston
+geometries in lockstep: one candidate is one row of a float matrix.
+Evaluating it through the four analyzer objects costs four Python
+constructions and a dozen method calls per candidate; here the whole
+population runs through one numba kernel with a parallel prange over
+the candidate index -- per-candidate work is a few hundred FLOPs and
+embarrassingly data-parallel, so this scales with cores (thread count
+via the NUMBA_NUM_THREADS environment variable).
+
+The conrod and crankshaft math is the already-compiled kernels from
+their modules (numba inlines njit-to-njit calls); the block and piston
+formulas are inlined here, matching their analyzers term for term.
+"""
+import math
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # pure-Python fallback, same semantics
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+    prange = range
+
+from .conrod import _conrod_kernel
+from .crankshaft import _crank_kernel
+
+# Geometry column layout of the (N, 36) design matrix, one candidate per
+# row. Conrod 0-8, crankshaft 9-19, block 20-28, piston 29-35.
+GEOMETRY_COLUMNS = (
+    # conrod
+    "conrod.beam_height", "conrod.beam_width", "conrod.web_thickness",
+    "conrod.flange_thickness", "conrod.center_length",
+    "conrod.big_end_width", "conrod.small_end_width",
+    "conrod.big_end_diameter", "conrod.small_end_diameter",
+    # crankshaft
+    "crank.main_journal_diameter", "crank.main_journal_width",
+    "crank.pin_diameter", "crank.pin_width", "crank.stroke",
+    "crank.cheek_thickness", "crank.cheek_radius",
+    "crank.cheek_hole_radius", "crank.fillet_main", "crank.fillet_pin",
+    "crank.cheek_sector_factor",
+    # block
+    "block.bore_diameter", "block.stroke", "block.bank_angle",
+    "block.bore_spacing", "block.deck_thickness",
+    "block.cylinder_wall_thickness", "block.main_bearing_width",
+    "block.main_bearing_height", "block.skirt_depth",
+    # piston
+    "piston.bore_diameter", "piston.compression_height",
+    "piston.pin_diameter", "piston.pin_boss_width",
+    "piston.crown_thickness", "piston.skirt_length",
+    "piston.skirt_thickness",
+)
+
+# Layout of the (15,) loads/materials vector, shared by all candidates
+LOAD_COLUMNS = (
+    "conrod.compression_force_n", "conrod.tensile_force_n",
+    "conrod.eccentricity_mm", "conrod.youngs_modulus",
+    "conrod.yield_strength", "conrod.fatigue_limit", "conrod.density",
+    "crank.density", "crank.shear_modulus", "crank.torque_nm",
+    "crank.force_n", "crank.inertia_kgm2",
+    "block.density", "peak_pressure_mpa", "piston.density",
+)
+
+# Columns of the (N, 19) output metrics matrix
+METRIC_COLUMNS = (
+    "conrod.mass_kg", "conrod.buckling_sf", "conrod.goodman_sf",
+    "conrod.bearing_big_mpa", "conrod.bearing_small_mpa",
+    "conrod.stress_comp_mpa",
+    "crank.mass_kg", "crank.shear_stress_mpa", "crank.bending_stress_mpa",
+    "crank.torsional_stiffness", "crank.natural_frequency_hz",
+    "block.mass_g", "block.hoop_stress_mpa", "block.deck_stress_mpa",
+    "block.bearing_pressure_mpa", "block.bulkhead_bending_stress_mpa",
+    "piston.mass_g", "piston.crown_bending_mpa", "piston.pin_bearing_mpa",
+)
+
+
+@njit(parallel=True, cache=True, fastmath=True)
+def eval_engine(A, loads):
+    """Evaluate N combined candidates in parallel.
+
+    `A` is the (N, 36) geometry matrix (GEOMETRY_COLUMNS order), `loads`
+    the (15,) loads/materials vector (LOAD_COLUMNS order). Returns the
+    (N, 19) metrics matrix in METRIC_COLUMNS order; threshold checks are
+    O(few) per candidate and stay with the caller in Python.
+    """
+    n = A.shape[0]
+    out = np.empty((n, 19), dtype=np.float64)
+    p = loads[13]
+    for i in prange(n):
+        # --- connecting rod (compiled kernel from conrod.py) ---
+        (rod_mass, _sc, _st, _sb, s_comp, _stt, _scrit, buckling_sf,
+         p_big, p_small, goodman_sf, _lam) = _conrod_kernel(
+            A[i, 0], A[i, 1], A[i, 2], A[i, 3], A[i, 4], A[i, 5],
+            A[i, 6], A[i, 7], A[i, 8],
+            loads[0], loads[1], loads[2], loads[3], loads[4], loads[5],
+            loads[6])
+        out[i, 0] = rod_mass
+        out[i, 1] = buckling_sf
+        out[i, 2] = goodman_sf
+        out[i, 3] = p_big
+        out[i, 4] = p_small
+        out[i, 5] = s_comp
+
+        # --- crankshaft (compiled kernel from crankshaft.py) ---
+        crank_mass, tau, sigma_bend, k_tors, fn = _crank_kernel(
+            A[i, 9], A[i, 10], A[i, 11], A[i, 12], A[i, 13], A[i, 14],
+            A[i, 15], A[i, 16], A[i, 17], A[i, 18], A[i, 19],
+            loads[7], loads[8], loads[9], loads[10], loads[11])
+        out[i, 6] = crank_mass
+        out[i, 7] = tau
+        out[i, 8] = sigma_bend
+        out[i, 9] = k_tors
+        out[i, 10] = fn
+
+        # --- cylinder block (same model as CylinderBlockAnalyzer) ---
+        ri = A[i, 20] / 2.0
+        ro = ri + A[i, 25]
+        deck_t = A[i, 24]
+        spacing = A[i, 23]
+        mb_w = A[i, 26]
+        mb_h = A[i, 27]
+        bank_off = spacing * math.sin(math.radians(A[i, 22] / 2.0))
+        wall_h = deck_t + A[i, 21] / 2.0 + A[i, 28]
+        wall_vol = math.pi * (ro * ro - ri * ri) * wall_h * 12.0
+        deck_vol = (spacing * 6.0) * (bank_off * 2.0) * deck_t
+        bulkhead_vol = mb_w * mb_h * spacing * 7.0
+        out[i, 11] = (wall_vol + deck_vol + bulkhead_vol) * 1e-3 * loads[12]
+        out[i, 12] = p * (ri * ri + ro * ro) / (ro * ro - ri * ri)
+        out[i, 13] = 0.75 * p * (ri / deck_t) ** 2
+        gas_force = p * math.pi * ri * ri
+        out[i, 14] = gas_force / (mb_w * mb_h)
+        out[i, 15] = gas_force * (A[i, 21] / 2.0) / ((mb_w * mb_h * mb_h) / 6.0)
+
+        # --- piston (same model as PistonAnalyzer) ---
+        r_p = A[i, 29] / 2.0
+        crown_t = A[i, 33]
+        pin_d = A[i, 31]
+        boss_w = A[i, 32]
+        crown_vol = math.pi * r_p * r_p * crown_t
+        boss_vol = 2.0 * (A[i, 30] * 0.6) * boss_w * (pin_d + 2.0 * boss_w)
+        skirt_ro = r_p - 0.5
+        skirt_ri = skirt_ro - A[i, 35]
+        skirt_vol = math.pi * (skirt_ro * skirt_ro
+                               - skirt_ri * skirt_ri) * A[i, 34]
+        out[i, 16] = (crown_vol + boss_vol + skirt_vol) * loads[14]
+        out[i, 17] = (3.0 * p * r_p * r_p) / (4.0 * crown_t * crown_t)
+        out[i, 18] = loads[10] / (2.0 * pin_d * boss_w)
+    return out
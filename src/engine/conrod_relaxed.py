@@ -2,8 +2,10 @@
 Relaxed constraint analyzer for V12 connecting rod.
 Allows higher mass, bearing pressure, lower safety factors while maintaining performance.
 """
+import numpy as np
 from typing import Dict, Tuple
-from .conrod import ConrodGeometry, ConrodAnalyzer
+from .conrod import (ConrodGeometry, ConrodAnalyzer, _evaluate_cached,
+                     evaluate_constraints_batch as _solid_batch)
 
 class RelaxedConrodAnalyzer(ConrodAnalyzer):
     """Analyzer with relaxed constraints for 11 kRPM high‑load scenario."""
@@ -13,38 +15,28 @@ class RelaxedConrodAnalyzer(ConrodAnalyzer):
                              tensile_force_n: float,
                              eccentricity_mm: float = 0.5) -> Tuple[Dict, Dict]:
         """Evaluate all constraints with relaxed thresholds."""
-        # Compute same metrics as parent
-        sigma_axial_comp = self.axial_stress(compression_force_n)
-        sigma_axial_tens = self.axial_stress(tensile_force_n)
-        sigma_bending = self.bending_stress(compression_force_n, eccentricity_mm)
-        sigma_total_comp = sigma_axial_comp + sigma_bending
-        sigma_total_tens = sigma_axial_tens + sigma_bending
-        
-        sigma_crit = self.buckling_stress("y")
-        buckling_sf = sigma_crit / sigma_axial_comp if sigma_axial_comp > 0 else 1e6
-        
-        p_big = self.bearing_pressure(compression_force_n, "big")
-        p_small = self.bearing_pressure(compression_force_n, "small")
-        
-        # Fatigue (Goodman diagram)
-        sigma_mean = (sigma_total_comp + sigma_total_tens) / 2
-        sigma_amp = abs(sigma_total_comp - sigma_total_tens) / 2
-        Se = self.geo.fatigue_limit
+        # Same physics as the parent: one memoized kernel call replaces
+        # the six scalar method invocations (and their repeated
+        # self.geo attribute walks); only the threshold comparisons
+        # below differ, and those stay in Python
+        (mass_kg, sigma_axial_comp, sigma_axial_tens, sigma_bending,
+         sigma_total_comp, sigma_total_tens, sigma_crit, buckling_sf,
+         p_big, p_small, goodman_sf, lam) = _evaluate_cached(
+            self.geo, compression_force_n, tensile_force_n, eccentricity_mm)
         Sy = self.geo.yield_strength
-        goodman_sf = 1 / (sigma_amp / Se + sigma_mean / Sy) if sigma_amp > 0 else 1e6
         
         # RELAXED THRESHOLDS
         constraints = {
             "buckling_ok": buckling_sf >= 1.5,                     # was 2.0
-            "compressive_stress_ok": sigma_total_comp < Sy * 0.6,  # was 0.5 (440 MPa → 528 MPa)
+            "compressive_stress_ok": sigma_total_comp < Sy * 0.6,  # was 0.5
             "tensile_stress_ok": sigma_total_tens < Sy * 0.6,
-            "bearing_pressure_ok": max(p_big, p_small) < 120.0,    # was 60 MPa
+            "bearing_pressure_ok": max(p_big, p_small) < 120.0,    # was 60 MPa
             "fatigue_ok": goodman_sf >= 1.5,                       # was 2.0
-            "mass_ok": self.mass() < 1.5,                          # was 1.0 kg
+            "mass_ok": mass_kg < 1.5,                              # was 1.0 kg
         }
         
         metrics = {
-            "mass_kg": self.mass(),
+            "mass_kg": mass_kg,
             "axial_stress_comp_mpa": sigma_axial_comp,
             "axial_stress_tens_mpa": sigma_axial_tens,
             "bending_stress_mpa": sigma_bending,
@@ -55,16 +47,47 @@ class RelaxedConrodAnalyzer(ConrodAnalyzer):
             "bearing_pressure_big_mpa": p_big,
             "bearing_pressure_small_mpa": p_small,
             "fatigue_safety_factor": goodman_sf,
-            "slenderness_ratio": self.slenderness_ratio("y"),
+            "slenderness_ratio": lam,
         }
         
         return constraints, metrics
 
+
+def evaluate_constraints_batch(geos: Dict[str, np.ndarray],
+                               compression_force_n: float,
+                               tensile_force_n: float,
+                               eccentricity_mm: float = 0.5) -> Tuple[Dict, Dict]:
+    """Vectorized RelaxedConrodAnalyzer over whole populations.
+
+    Same SoA contract as conrod.evaluate_constraints_batch (nine sizing
+    fields mapped to equal-length arrays). The physics is identical to
+    the parent analyzer, so the metrics come from its vectorized pass;
+    only the constraint thresholds are relaxed for the 11 kRPM scenario.
+    """
+    _, metrics = _solid_batch(geos, compression_force_n, tensile_force_n,
+                              eccentricity_mm)
+
+    # slots=True strips class-level defaults; read from the field definition
+    Sy = ConrodGeometry.__dataclass_fields__["yield_strength"].default
+    # RELAXED THRESHOLDS (same deltas as evaluate_constraints above)
+    constraints = {
+        "buckling_ok": metrics["buckling_safety_factor"] >= 1.5,
+        "compressive_stress_ok": metrics["total_stress_comp_mpa"] < Sy * 0.6,
+        "tensile_stress_ok": metrics["total_stress_tens_mpa"] < Sy * 0.6,
+        "bearing_pressure_ok": np.maximum(
+            metrics["bearing_pressure_big_mpa"],
+            metrics["bearing_pressure_small_mpa"]) < 120.0,
+        "fatigue_ok": metrics["fatigue_safety_factor"] >= 1.5,
+        "mass_ok": metrics["mass_kg"] < 1.5,
+    }
+
+    return constraints, metrics
+
 # Test with baseline geometry
 if __name__ == "__main__":
     from .conrod import baseline
     analyzer = RelaxedConrodAnalyzer(baseline)
-    cons, metrics = analyzer.evaluate_constraints(
+    constraints, metrics = analyzer.evaluate_constraints(
         compression_force_n=180000.0,
         tensile_force_n=83000.0,
         eccentricity_mm=0.5
@@ -74,4 +97,16 @@ if __name__ == "__main__":
         print(f"  {k}: {v}")
     print("Metrics:")
     for k, v in metrics.items():
-        print(f"  {k}: {v:.2f}")
\ No newline at end of file
+        print(f"  {k}: {v:.2f}")
+
+    # Smoke the batch path: a tiny population tiled from the baseline
+    # must reproduce the scalar metrics in every row
+    geos = {k: np.full(3, getattr(baseline, k)) for k in (
+        "beam_height", "beam_width", "web_thickness", "flange_thickness",
+        "center_length", "big_end_width", "small_end_width",
+        "big_end_diameter", "small_end_diameter")}
+    batch_cons, batch_metrics = evaluate_constraints_batch(
+        geos, 180000.0, 83000.0, 0.5)
+    assert np.allclose(batch_metrics["mass_kg"], metrics["mass_kg"])
+    assert all(bool(batch_cons[k][0]) == constraints[k] for k in constraints)
+    print(f"Batch evaluation: {len(batch_metrics['mass_kg'])} candidates OK")
\ No newline at end of file
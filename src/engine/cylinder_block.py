@@ -5,6 +5,7 @@ Geometry: cylinder bore spacing, deck thickness, cylinder wall thickness, main b
 Loads: peak cylinder pressure, inertial forces, main bearing reactions.
 """
 import math
+import numpy as np
 from dataclasses import dataclass
 from typing import Dict, Tuple, List
 
@@ -56,26 +57,43 @@ class CylinderBlockGeometry:
     cylinder_count: int = 12
     bank_count: int = 2
     
-    # Derived dimensions
-    @property
-    def bore_radius(self) -> float:
-        return self.bore_diameter / 2.0
-    
-    @property
-    def cylinder_center_distance(self) -> float:
-        """Distance between cylinder centers along bank (same as bore_spacing)."""
-        return self.bore_spacing
-    
-    @property
-    def bank_offset(self) -> float:
-        """Offset between banks in transverse direction (simplified)."""
-        # For V‑engine, banks are offset by some distance; approximate.
-        return self.bore_spacing * math.sin(math.radians(self.bank_angle / 2.0))
+    def __post_init__(self):
+        # Derived dimensions, computed once: property descriptors were
+        # re-running the trig on every access inside validate()/the
+        # stress and mass paths
+        self.bore_radius = self.bore_diameter / 2.0
+        # Distance between cylinder centers along bank (same as bore_spacing)
+        self.cylinder_center_distance = self.bore_spacing
+        # Offset between banks in transverse direction (simplified).
+        # For V-engine, banks are offset by some distance; approximate.
+        self._sin_half_bank = math.sin(math.radians(self.bank_angle / 2.0))
+        self.bank_offset = self.bore_spacing * self._sin_half_bank
+        # Outer diameter of the water-jacket cavity; validate() needs it
+        # twice and it never changes after construction
+        self._outer_diameter = (self.bore_diameter
+                                + 2 * self.cylinder_wall_thickness
+                                + 2 * self.water_jacket_thickness)
     
     def validate(self) -> Tuple[bool, str]:
         """Check geometric feasibility."""
+        # Cheap threshold checks first; the spacing/volume checks below
+        # cost arithmetic and usually pass
+        if self.deck_thickness < 5.0:
+            return False, f"Deck thickness {self.deck_thickness:.1f} mm too thin"
+        if self.cylinder_wall_thickness < 3.0:
+            return False, f"Cylinder wall thickness {self.cylinder_wall_thickness:.1f} mm too thin"
+        if self.water_jacket_thickness < 2.0:
+            return False, f"Water jacket thickness {self.water_jacket_thickness:.1f} mm too thin"
+        if self.main_bearing_width < 10.0:
+            return False, f"Main bearing width {self.main_bearing_width:.1f} mm too narrow"
+        if self.main_bearing_height < 15.0:
+            return False, f"Main bearing height {self.main_bearing_height:.1f} mm too short"
+        if self.skirt_depth < 10.0:
+            return False, f"Skirt depth {self.skirt_depth:.1f} mm too shallow"
+        if self.pan_rail_width < 5.0:
+            return False, f"Pan rail width {self.pan_rail_width:.1f} mm too narrow"
         # Outer diameter of water jacket cavity (hole in block)
-        outer_diameter = self.bore_diameter + 2*self.cylinder_wall_thickness + 2*self.water_jacket_thickness
+        outer_diameter = self._outer_diameter
         clearance = 10.0  # mm
         
         if self.bore_spacing < outer_diameter + clearance:
@@ -91,85 +109,306 @@ class CylinderBlockGeometry:
         jacket_volume = math.pi * (jacket_outer_radius ** 2 - (self.bore_radius + self.cylinder_wall_thickness) ** 2) * cell_height
         if cell_volume <= bore_volume + jacket_volume:
             return False, f"Metal volume per cylinder non-positive (cell {cell_volume:.0f} <= bore+jacket {bore_volume+jacket_volume:.0f})"
-        if self.deck_thickness < 5.0:
-            return False, f"Deck thickness {self.deck_thickness:.1f} mm too thin"
-        if self.cylinder_wall_thickness < 3.0:
-            return False, f"Cylinder wall thickness {self.cylinder_wall_thickness:.1f} mm too thin"
-        if self.water_jacket_thickness < 2.0:
-            return False, f"Water jacket thickness {self.water_jacket_thickness:.1f} mm too thin"
-        if self.main_bearing_width < 10.0:
-            return False, f"Main bearing width {self.main_bearing_width:.1f} mm too narrow"
-        if self.main_bearing_height < 15.0:
-            return False, f"Main bearing height {self.main_bearing_height:.1f} mm too short"
-        if self.skirt_depth < 10.0:
-            return False, f"Skirt depth {self.skirt_depth:.1f} mm too shallow"
-        if self.pan_rail_width < 5.0:
-            return False, f"Pan rail width {self.pan_rail_width:.1f} mm too narrow"
         return True, "OK"
 
+    @classmethod
+    def validate_batch(cls, geos: Dict[str, np.ndarray]) -> np.ndarray:
+        """Vectorized feasibility screen over N candidate geometries.
+
+        Same checks as validate() (thresholds, spacing, bank offset,
+        metal volume) collapsed into masked comparisons -- one pass to
+        drop infeasible designs from a population, no per-candidate
+        Python walk. Returns an (N,) boolean mask.
+        """
+        bore = np.asarray(geos["bore_diameter"], dtype=float)
+        stroke = np.asarray(geos["stroke"], dtype=float)
+        bank_angle = np.asarray(geos["bank_angle"], dtype=float)
+        spacing = np.asarray(geos["bore_spacing"], dtype=float)
+        deck_t = np.asarray(geos["deck_thickness"], dtype=float)
+        wall_t = np.asarray(geos["cylinder_wall_thickness"], dtype=float)
+        jacket_t = np.asarray(geos["water_jacket_thickness"], dtype=float)
+        mb_w = np.asarray(geos["main_bearing_width"], dtype=float)
+        mb_h = np.asarray(geos["main_bearing_height"], dtype=float)
+        skirt = np.asarray(geos["skirt_depth"], dtype=float)
+        pan_rail = np.asarray(geos["pan_rail_width"], dtype=float)
+
+        # Minimum-dimension thresholds in one stacked comparison
+        fields = np.stack([deck_t, wall_t, jacket_t, mb_w, mb_h, skirt,
+                           pan_rail], axis=1)
+        limits = np.array([5.0, 3.0, 2.0, 10.0, 15.0, 10.0, 5.0])
+        ok = np.all(fields >= limits, axis=1)
+
+        clearance = 10.0  # mm
+        outer_diameter = bore + 2*wall_t + 2*jacket_t
+        bank_offset = spacing * np.sin(np.radians(bank_angle / 2.0))
+        ok &= spacing >= outer_diameter + clearance
+        ok &= bank_offset >= outer_diameter/2 + clearance
+
+        bore_radius = bore / 2.0
+        cell_height = deck_t + stroke/2.0 + skirt
+        cell_volume = spacing * bank_offset * cell_height
+        bore_volume = np.pi * bore_radius**2 * cell_height
+        jacket_outer_radius = bore_radius + wall_t + jacket_t
+        jacket_volume = np.pi * (jacket_outer_radius**2
+                                 - (bore_radius + wall_t)**2) * cell_height
+        ok &= cell_volume > bore_volume + jacket_volume
+        return ok
+
+    # Column order for validate_matrix design matrices
+    MATRIX_COLUMNS = ("bore_diameter", "stroke", "bank_angle",
+                      "bore_spacing", "deck_thickness",
+                      "cylinder_wall_thickness", "water_jacket_thickness",
+                      "main_bearing_width", "main_bearing_height",
+                      "skirt_depth", "pan_rail_width")
+
+    @classmethod
+    def validate_matrix(cls, M: np.ndarray) -> np.ndarray:
+        """Feasibility mask for an (N, 11) design matrix.
+
+        Population-based optimizers carry candidates as rows of one
+        float matrix; this slices the columns (order per MATRIX_COLUMNS)
+        and runs the same broadcasted screen as validate_batch -- use it
+        to drop the typically large infeasible fraction before any
+        stress evaluation. Returns an (N,) boolean mask."""
+        M = np.asarray(M, dtype=float)
+        return cls.validate_batch(dict(zip(cls.MATRIX_COLUMNS, M.T)))
+
+
+def ks_aggregate(values, limits, rho: float = 50.0) -> float:
+    """Kreisselmeier-Steinhauser aggregation of normalized constraints.
+
+    Collapses `values[i] < limits[i]` checks into one smooth scalar
+    g_KS ~= max(values/limits - 1); feasible iff g_KS <= 0. Smoothness
+    (controlled by `rho`; higher = closer to the hard max) is what a
+    gradient-based outer optimizer needs -- one differentiable margin
+    instead of a vector of booleans. Uses the shifted log-sum-exp form
+    so large rho*margin products cannot overflow."""
+    v = np.asarray(values, dtype=float) / np.asarray(limits, dtype=float) - 1.0
+    m = v.max()
+    return m + np.log(np.sum(np.exp(rho * (v - m)))) / rho
+
+
+def _block_volume(geo: CylinderBlockGeometry) -> float:
+    """Total metal volume (mm³) of the simplified block model.
+
+    Material-independent; mass for any material is volume times density."""
+    ri = geo.bore_radius
+    wall_outer_radius = ri + geo.cylinder_wall_thickness
+    # Height of cylinder wall (deck to skirt bottom)
+    wall_height = geo.deck_thickness + geo.stroke/2.0 + geo.skirt_depth
+    # Volume of cylinder walls (12 cylinders)
+    wall_volume = math.pi * (wall_outer_radius**2 - ri**2) * wall_height * geo.cylinder_count
+
+    # Deck volume (simplified as rectangular plate covering both banks)
+    deck_length = geo.bore_spacing * 6  # length of one bank
+    deck_width = geo.bank_offset * 2    # width across both banks
+    deck_volume = deck_length * deck_width * geo.deck_thickness
+
+    # Main bearing bulkhead volume (7 bulkheads)
+    bulkhead_volume = geo.main_bearing_width * geo.main_bearing_height * geo.bore_spacing * 7
+
+    # Ignore water jacket cavities, oil passages, etc.
+    return wall_volume + deck_volume + bulkhead_volume
+
+
+def _stresses(geo: CylinderBlockGeometry, p):
+    """Stress formulas for pressure(s) `p` (scalar or ndarray, MPa).
+
+    Material-independent, so one pass serves every material; with an
+    array of pressures the whole sweep is a handful of broadcasts.
+    Returns (hoop, deck, bearing_pressure, bulkhead_bending)."""
+    # 1. Cylinder wall hoop stress (thick-cylinder formula)
+    ri = geo.bore_radius
+    ro = ri + geo.cylinder_wall_thickness
+    hoop_stress = p * (ri**2 + ro**2) / (ro**2 - ri**2)
+
+    # 2. Deck bending stress (clamped circular plate under uniform pressure)
+    deck_stress = 0.75 * p * (ri / geo.deck_thickness) ** 2
+
+    # 3. Main bearing bulkhead bearing pressure
+    peak_force_n = p * math.pi * ri**2  # N
+    bearing_area = geo.main_bearing_width * geo.main_bearing_height  # mm²
+    bearing_pressure = peak_force_n / bearing_area  # MPa
+
+    # 4. Bulkhead bending stress (simplified cantilever)
+    offset = geo.stroke / 2.0  # moment arm (mm)
+    section_modulus = (geo.main_bearing_width * geo.main_bearing_height**2) / 6.0  # mm³
+    bending_stress = peak_force_n * offset / section_modulus  # MPa
+
+    return hoop_stress, deck_stress, bearing_pressure, bending_stress
+
+
+def evaluate_materials_batch(geo: CylinderBlockGeometry,
+                             peak_pressure_mpa=25.0,
+                             material_keys=("CGI_450", "A356_T6", "7075_T6")):
+    """Evaluate all materials (and optionally a pressure sweep) in one pass.
+
+    The stress formulas do not depend on the material, so they run once;
+    the material axis is just a broadcast against a vector of yield
+    strengths (and densities for mass). `peak_pressure_mpa` may be a
+    scalar or an array -- results broadcast to shape
+    (len(material_keys),) + pressure.shape.
+    Returns (constraints, metrics) dicts of arrays.
+    """
+    p = np.asarray(peak_pressure_mpa, dtype=float)
+    hoop, deck, bearing, bulkhead = _stresses(geo, p)
+
+    Y = np.array([MATERIALS[k]["yield_strength"] for k in material_keys])
+    rho = np.array([MATERIALS[k]["density"] for k in material_keys])
+    # Material axis first, pressure axis after
+    Y = Y.reshape((-1,) + (1,) * p.ndim)
+    mass_g = _block_volume(geo) * 1e-3 * rho
+
+    geometric_ok = geo.validate()[0]
+    constraints = {
+        "hoop_stress_ok": hoop < 0.8 * Y,
+        "deck_stress_ok": deck < 1.0 * Y,
+        "bearing_pressure_ok": np.broadcast_to(bearing < 120.0, (len(material_keys),) + p.shape),
+        "bulkhead_bending_ok": bulkhead < 0.8 * Y,
+        "mass_ok": mass_g < 200000.0,
+        "geometric_ok": np.full(len(material_keys), geometric_ok),
+    }
+
+    metrics = {
+        "mass_g": mass_g,
+        "mass_kg": mass_g / 1000.0,
+        "hoop_stress_mpa": hoop,
+        "deck_stress_mpa": deck,
+        "bearing_pressure_mpa": bearing,
+        "bulkhead_bending_stress_mpa": bulkhead,
+        "material": [MATERIALS[k]["name"] for k in material_keys],
+    }
+    return constraints, metrics
+
+
+def evaluate_blocks_soa(geos: Dict[str, np.ndarray],
+                        peak_pressure_mpa: float = 25.0,
+                        material_keys=("CGI_450", "A356_T6", "7075_T6")):
+    """Vectorized block evaluation over N designs x M materials.
+
+    `geos` maps the geometry fields (bore_diameter, stroke, bank_angle,
+    bore_spacing, deck_thickness, cylinder_wall_thickness,
+    main_bearing_width, main_bearing_height, skirt_depth) to equal-length
+    arrays. Designs broadcast along axis 0, materials along axis 1, so
+    every constraint table comes out (N, M) from one NumPy pass instead
+    of an O(N*M) Python loop. Geometric feasibility screening is
+    validate()'s job and is not repeated here.
+    Returns (constraints, metrics) dicts of arrays.
+    """
+    bore = np.asarray(geos["bore_diameter"], dtype=float)
+    stroke = np.asarray(geos["stroke"], dtype=float)
+    bank_angle = np.asarray(geos["bank_angle"], dtype=float)
+    spacing = np.asarray(geos["bore_spacing"], dtype=float)
+    deck_t = np.asarray(geos["deck_thickness"], dtype=float)
+    wall_t = np.asarray(geos["cylinder_wall_thickness"], dtype=float)
+    mb_w = np.asarray(geos["main_bearing_width"], dtype=float)
+    mb_h = np.asarray(geos["main_bearing_height"], dtype=float)
+    skirt = np.asarray(geos["skirt_depth"], dtype=float)
+
+    Y = np.array([MATERIALS[k]["yield_strength"] for k in material_keys])
+    rho = np.array([MATERIALS[k]["density"] for k in material_keys])
+
+    p = peak_pressure_mpa
+    ri = bore / 2.0
+    ro = ri + wall_t
+
+    # Stresses, (N,) -- same formulas as _stresses()
+    hoop = p * (ri**2 + ro**2) / (ro**2 - ri**2)
+    deck = 0.75 * p * (ri / deck_t) ** 2
+    F = p * np.pi * ri**2
+    bearing = F / (mb_w * mb_h)
+    bulkhead = F * (stroke / 2.0) / (mb_w * mb_h**2 / 6.0)
+
+    # Metal volume, (N,) -- same model as _block_volume()
+    wall_height = deck_t + stroke / 2.0 + skirt
+    wall_volume = np.pi * (ro**2 - ri**2) * wall_height * 12
+    bank_offset = spacing * np.sin(np.radians(bank_angle / 2.0))
+    deck_volume = spacing * 6 * bank_offset * 2 * deck_t
+    bulkhead_volume = mb_w * mb_h * spacing * 7
+    volume = wall_volume + deck_volume + bulkhead_volume
+
+    # Broadcast designs (N, 1) against materials (M,)
+    mass_g = volume[:, None] * 1e-3 * rho
+    constraints = {
+        "hoop_stress_ok": hoop[:, None] < 0.8 * Y,
+        "deck_stress_ok": deck[:, None] < 1.0 * Y,
+        "bearing_pressure_ok": np.broadcast_to(
+            (bearing < 120.0)[:, None], mass_g.shape),
+        "bulkhead_bending_ok": bulkhead[:, None] < 0.8 * Y,
+        "mass_ok": mass_g < 200000.0,
+    }
+
+    metrics = {
+        "mass_g": mass_g,
+        "mass_kg": mass_g / 1000.0,
+        "hoop_stress_mpa": hoop,
+        "deck_stress_mpa": deck,
+        "bearing_pressure_mpa": bearing,
+        "bulkhead_bending_stress_mpa": bulkhead,
+    }
+    return constraints, metrics
+
+
 class CylinderBlockAnalyzer:
     """Perform stress, stiffness, and mass analysis of cylinder block."""
     def __init__(self, geometry: CylinderBlockGeometry, material_key: str = "CGI_450"):
         self.geo = geometry
         self.material = MATERIALS[material_key]
     
+    def _analyze(self, p: float) -> Tuple[float, Dict[str, float]]:
+        """Fused mass + stress pass for pressure `p` (MPa).
+
+        Mass and the stress formulas share most of their inputs (bore
+        radius, wall thickness, deck thickness, bearing section); this
+        binds each geometry field to a local exactly once and reuses the
+        shared subexpressions, where the separate compute_mass /
+        compute_stresses calls each re-walked self.geo attribute lookups.
+        Returns (mass_g, stresses)."""
+        geo = self.geo
+        ri = geo.bore_radius
+        wall_t = geo.cylinder_wall_thickness
+        deck_t = geo.deck_thickness
+        stroke = geo.stroke
+        bb_w = geo.main_bearing_width
+        bb_h = geo.main_bearing_height
+        spacing = geo.bore_spacing
+        ro = ri + wall_t
+
+        # --- volume / mass (same model as _block_volume) ---
+        wall_height = deck_t + stroke / 2.0 + geo.skirt_depth
+        wall_volume = math.pi * (ro**2 - ri**2) * wall_height * geo.cylinder_count
+        deck_volume = (spacing * 6) * (geo.bank_offset * 2) * deck_t
+        bulkhead_volume = bb_w * bb_h * spacing * 7
+        mass_g = (wall_volume + deck_volume + bulkhead_volume) * 1e-3 \
+            * self.material["density"]
+
+        # --- stresses (same formulas as _stresses) ---
+        hoop_stress = p * (ri**2 + ro**2) / (ro**2 - ri**2)
+        deck_stress = 0.75 * p * (ri / deck_t) ** 2
+        peak_force_n = p * math.pi * ri**2  # shared by bearing and bulkhead
+        bearing_pressure = peak_force_n / (bb_w * bb_h)
+        section_modulus = (bb_w * bb_h**2) / 6.0
+        bending_stress = peak_force_n * (stroke / 2.0) / section_modulus
+
+        return mass_g, {
+            "hoop_stress_mpa": hoop_stress,
+            "deck_stress_mpa": deck_stress,
+            "bearing_pressure_mpa": bearing_pressure,
+            "bulkhead_bending_stress_mpa": bending_stress,
+        }
+
     def compute_mass(self) -> float:
         """Estimate block mass (grams) using simplified volume model."""
-        ri = self.geo.bore_radius
-        wall_outer_radius = ri + self.geo.cylinder_wall_thickness
-        # Height of cylinder wall (deck to skirt bottom)
-        wall_height = self.geo.deck_thickness + self.geo.stroke/2.0 + self.geo.skirt_depth
-        # Volume of cylinder walls (12 cylinders)
-        wall_volume = math.pi * (wall_outer_radius**2 - ri**2) * wall_height * self.geo.cylinder_count
-        
-        # Deck volume (simplified as rectangular plate covering both banks)
-        deck_length = self.geo.bore_spacing * 6  # length of one bank
-        deck_width = self.geo.bank_offset * 2    # width across both banks
-        deck_volume = deck_length * deck_width * self.geo.deck_thickness
-        
-        # Main bearing bulkhead volume (7 bulkheads)
-        bulkhead_volume = self.geo.main_bearing_width * self.geo.main_bearing_height * self.geo.bore_spacing * 7
-        
-        # Total material volume (ignore water jacket cavities, oil passages, etc.)
-        total_volume = wall_volume + deck_volume + bulkhead_volume  # mm³
         # Convert to grams: mm³ → cm³ (divide by 1000), then multiply by density g/cm³
-        mass_g = total_volume * 1e-3 * self.material["density"]
-        return mass_g
+        return self._analyze(0.0)[0]
     
     def compute_stresses(self, peak_pressure_mpa: float) -> Dict[str, float]:
         """Compute key stresses (MPa)."""
-        # 1. Cylinder wall hoop stress (thick‑cylinder formula)
-        ri = self.geo.bore_radius
-        ro = ri + self.geo.cylinder_wall_thickness
-        hoop_stress = peak_pressure_mpa * (ri**2 + ro**2) / (ro**2 - ri**2)
-        
-        # 2. Deck bending stress (simplified as clamped circular plate under uniform pressure)
-        # Using formula for stress at center of clamped circular plate: σ = 0.75 * p * (r/t)^2
-        deck_stress = 0.75 * peak_pressure_mpa * (ri / self.geo.deck_thickness) ** 2
-        
-        # 3. Main bearing bulkhead bearing pressure (force distributed over bearing area)
-        # 1 MPa = 1 N/mm², area = π * ri² (mm²), force (N) = peak_pressure_mpa * area
-        peak_force_n = peak_pressure_mpa * math.pi * ri**2  # N
-        bearing_area = self.geo.main_bearing_width * self.geo.main_bearing_height  # mm²
-        bearing_pressure = peak_force_n / bearing_area  # MPa (since 1 N/mm² = 1 MPa)
-        
-        # 4. Bulkhead bending stress (simplified cantilever)
-        offset = self.geo.stroke / 2.0  # moment arm (mm)
-        moment = peak_force_n * offset  # N·mm
-        section_modulus = (self.geo.main_bearing_width * self.geo.main_bearing_height**2) / 6.0  # mm³
-        bending_stress = moment / section_modulus  # MPa
-        
-        return {
-            "hoop_stress_mpa": hoop_stress,
-            "deck_stress_mpa": deck_stress,
-            "bearing_pressure_mpa": bearing_pressure,
-            "bulkhead_bending_stress_mpa": bending_stress,
-        }
+        return self._analyze(peak_pressure_mpa)[1]
     
     def evaluate_constraints(self, peak_pressure_mpa: float = 25.0) -> Tuple[Dict[str, bool], Dict[str, float]]:
         """Evaluate design against constraints. Returns (constraint_satisfied, metrics)."""
-        mass_g = self.compute_mass()
-        stresses = self.compute_stresses(peak_pressure_mpa)
+        mass_g, stresses = self._analyze(peak_pressure_mpa)
         
         # Constraint limits (relaxed per user request)
         yield_strength = self.material["yield_strength"]
@@ -182,10 +421,21 @@ class CylinderBlockAnalyzer:
             "geometric_ok": self.geo.validate()[0],
         }
         
+        # Smooth aggregate of the quantitative limits (geometric validity
+        # stays boolean): feasible iff ks_constraint <= 0. Optimizers
+        # differentiate this; the booleans above remain for reporting.
+        ks_val = ks_aggregate(
+            [stresses["hoop_stress_mpa"], stresses["deck_stress_mpa"],
+             stresses["bearing_pressure_mpa"],
+             stresses["bulkhead_bending_stress_mpa"], mass_g],
+            [0.8 * yield_strength, yield_strength, 120.0,
+             0.8 * yield_strength, 200000.0])
+        
         metrics = {
             "mass_g": mass_g,
             "mass_kg": mass_g / 1000.0,
             **stresses,
+            "ks_constraint": ks_val,
             "material": self.material["name"],
         }
         return constraints, metrics
@@ -231,7 +481,18 @@ if __name__ == "__main__":
         pan_rail_width=15.0,
     )
     
-    for mat in ["CGI_450", "A356_T6", "7075_T6"]:
-        analyzer = CylinderBlockAnalyzer(geo, mat)
-        analyzer.print_report(peak_pressure_mpa=25.0)
-        print()
\ No newline at end of file
+    # One batched pass: stresses are material-independent, so they are
+    # computed once and compared against the whole yield-strength vector
+    mats = ("CGI_450", "A356_T6", "7075_T6")
+    constraints, metrics = evaluate_materials_batch(geo, peak_pressure_mpa=25.0,
+                                                    material_keys=mats)
+    print("=== CYLINDER BLOCK ANALYSIS (25.0 MPa peak) ===")
+    print("Stresses (MPa, material-independent):")
+    print(f"  Hoop (cylinder wall): {metrics['hoop_stress_mpa']:.1f}")
+    print(f"  Deck bending: {metrics['deck_stress_mpa']:.1f}")
+    print(f"  Bearing pressure: {metrics['bearing_pressure_mpa']:.1f}")
+    print(f"  Bulkhead bending: {metrics['bulkhead_bending_stress_mpa']:.1f}")
+    for i, mat in enumerate(mats):
+        print(f"\n{metrics['material'][i]}: mass {metrics['mass_kg'][i]:.1f} kg")
+        for k, v in constraints.items():
+            print(f"  {k}: {bool(np.asarray(v)[i])}")
\ No newline at end of file
@@ -2,13 +2,27 @@
 Analytical piston model for V12 twin‑charged engine.
 Forged aluminum (2618‑T6), optimized for strength‑to‑weight and thermal fatigue.
 """
+import math
 import numpy as np
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Tuple, Dict
 
-@dataclass
+try:
+    from numba import float64
+    from numba.experimental import jitclass
+except ImportError:  # pure-Python fallback, same semantics
+    float64 = None
+    jitclass = None
+
+@dataclass(frozen=True, slots=True)
 class PistonGeometry:
-    """Parameters defining a piston."""
+    """Parameters defining a piston.
+
+    Slotted because GA evaluators construct one instance per candidate;
+    slots skip the per-instance attribute dict. Frozen so instances hash
+    by field values, letting the CAD builder memoize on the geometry.
+    """
     # Primary dimensions
     bore_diameter: float        # mm (cylinder bore)
     compression_height: float   # mm (pin center to crown)
@@ -28,74 +42,164 @@ class PistonGeometry:
     yield_strength: float = 310.0   # MPa at 150°C
     thermal_conductivity: float = 130.0  # W/(m·K)
 
+class _PistonKernel:
+    """Scalar piston math over plain floats.
+
+    Compiled as a numba jitclass when numba is available, so construction
+    and every method call run without Python attribute dispatch -- the
+    shape an optimizer inner loop wants. The same class body serves as
+    the pure-Python fallback."""
+
+    def __init__(self, bore, comp_height, pin_d, pin_boss_w, crown_t,
+                 skirt_length, skirt_t, density, Sy):
+        self.bore = bore
+        self.comp_height = comp_height
+        self.pin_d = pin_d
+        self.pin_boss_w = pin_boss_w
+        self.crown_t = crown_t
+        self.skirt_length = skirt_length
+        self.skirt_t = skirt_t
+        self.density = density
+        self.Sy = Sy
+
+    def crown_surface_area(self):
+        return math.pi * (self.bore / 2.0)**2
+
+    def crown_volume(self):
+        return self.crown_surface_area() * self.crown_t
+
+    def pin_boss_volume(self):
+        boss_height = self.comp_height * 0.6
+        boss_width = self.pin_d + 2.0 * self.pin_boss_w
+        return 2.0 * boss_height * self.pin_boss_w * boss_width
+
+    def skirt_volume(self):
+        outer_radius = self.bore / 2.0 - 0.5
+        inner_radius = outer_radius - self.skirt_t
+        skirt_area = math.pi * (outer_radius**2 - inner_radius**2)
+        return skirt_area * self.skirt_length
+
+    def total_volume(self):
+        return (self.crown_volume() + self.pin_boss_volume()
+                + self.skirt_volume())
+
+    def mass(self):
+        return self.total_volume() * self.density
+
+    def crown_bending_stress(self, peak_pressure_mpa):
+        r = self.bore / 2.0
+        return (3.0 * peak_pressure_mpa * r**2) / (4.0 * self.crown_t**2)
+
+    def pin_bearing_pressure(self, peak_force_n):
+        return peak_force_n / (2.0 * self.pin_d * self.pin_boss_w)
+
+
+if jitclass is not None:
+    PistonAnalyzerJit = jitclass([
+        ("bore", float64), ("comp_height", float64), ("pin_d", float64),
+        ("pin_boss_w", float64), ("crown_t", float64),
+        ("skirt_length", float64), ("skirt_t", float64),
+        ("density", float64), ("Sy", float64),
+    ])(_PistonKernel)
+else:
+    PistonAnalyzerJit = _PistonKernel
+
+
 class PistonAnalyzer:
-    """Analyze piston for mechanical stress, thermal stress, and mass."""
+    """Analyze piston for mechanical stress, thermal stress, and mass.
+
+    The geometric volumes depend only on the (frozen) geometry, so they
+    are cached_propertys: optimizer loops that re-evaluate the same
+    analyzer under varying loads pay for them once.
+    """
     
     def __init__(self, geometry: PistonGeometry):
         self.geo = geometry
+        self._jit = PistonAnalyzerJit(
+            geometry.bore_diameter, geometry.compression_height,
+            geometry.pin_diameter, geometry.pin_boss_width,
+            geometry.crown_thickness, geometry.skirt_length,
+            geometry.skirt_thickness, geometry.density,
+            geometry.yield_strength)
     
+    @cached_property
     def crown_surface_area(self) -> float:
         """Crown surface area exposed to combustion (mm²)."""
         # Approximate as flat circle (ignoring dome/dish)
-        return np.pi * (self.geo.bore_diameter / 2)**2
+        return self._jit.crown_surface_area()
     
+    @cached_property
     def crown_volume(self) -> float:
         """Volume of crown material (mm³)."""
-        area = self.crown_surface_area()
-        return area * self.geo.crown_thickness
+        return self._jit.crown_volume()
     
+    @cached_property
     def pin_boss_volume(self) -> float:
         """Volume of pin boss region (simplified as two blocks)."""
-        # Boss approximated as rectangular block around pin
-        boss_height = self.geo.compression_height * 0.6  # guess
-        boss_depth = self.geo.pin_boss_width
-        boss_width = self.geo.pin_diameter + 2 * self.geo.pin_boss_width
-        return 2 * boss_height * boss_depth * boss_width
+        return self._jit.pin_boss_volume()
     
+    @cached_property
     def skirt_volume(self) -> float:
         """Volume of skirt (simplified as cylindrical shell)."""
-        outer_radius = self.geo.bore_diameter / 2 - 0.5  # clearance
-        inner_radius = outer_radius - self.geo.skirt_thickness
-        skirt_area = np.pi * (outer_radius**2 - inner_radius**2)
-        return skirt_area * self.geo.skirt_length
+        return self._jit.skirt_volume()
     
+    @cached_property
     def total_volume(self) -> float:
         """Total piston volume (mm³)."""
-        # Approximate sum of main components
-        return (self.crown_volume() + self.pin_boss_volume() +
-                self.skirt_volume())
+        return self._jit.total_volume()
     
+    @cached_property
     def mass(self) -> float:
         """Piston mass (g)."""
-        return self.total_volume() * self.geo.density
+        return self._jit.mass()
     
     def crown_bending_stress(self, peak_pressure_mpa: float) -> float:
-        """Bending stress in crown due to gas pressure (MPa)."""
-        # Simplified: clamped circular plate with uniform pressure
-        # σ_max = (3 * p * r²) / (4 * t²)  (for clamped edges)
-        p = peak_pressure_mpa
-        r = self.geo.bore_diameter / 2
-        t = self.geo.crown_thickness
-        return (3 * p * r**2) / (4 * t**2)
+        """Bending stress in crown due to gas pressure (MPa).
+
+        Simplified: clamped circular plate with uniform pressure,
+        σ_max = (3·p·r²)/(4·t²)."""
+        return self._jit.crown_bending_stress(peak_pressure_mpa)
     
     def pin_bearing_pressure(self, peak_force_n: float) -> float:
-        """Bearing pressure on piston pin (MPa)."""
-        # Projected area = pin_diameter × pin_boss_width (for one boss, ×2 for two)
-        area = 2 * self.geo.pin_diameter * self.geo.pin_boss_width
-        return peak_force_n / area
+        """Bearing pressure on piston pin (MPa).
+
+        Projected area = 2 × pin_diameter × pin_boss_width (two bosses)."""
+        return self._jit.pin_bearing_pressure(peak_force_n)
     
-    def evaluate_constraints(self, peak_pressure_mpa: float,
-                            peak_force_n: float,
-                            tensile_force_n: float = None) -> Tuple[Dict[str, bool], Dict[str, float]]:
-        """Evaluate design constraints and return metrics."""
+    def evaluate_constraints(self, peak_pressure_mpa,
+                            peak_force_n,
+                            tensile_force_n=None) -> Tuple[Dict, Dict]:
+        """Evaluate design constraints and return metrics.
+
+        Loads may be scalars or equal-shape arrays: passing a sweep of
+        operating points (pressure/force per RPM cell) evaluates all of
+        them elementwise in one call, with metrics["any_violation"] as
+        a ready-made mask over the sweep. Scalars keep the compiled
+        kernel path.
+        """
         if tensile_force_n is None:
             tensile_force_n = peak_force_n  # default to same as compression
+        sweep = any(isinstance(x, np.ndarray)
+                    for x in (peak_pressure_mpa, peak_force_n, tensile_force_n))
         metrics = {}
-        metrics["mass_g"] = self.mass()
-        metrics["crown_bending_mpa"] = self.crown_bending_stress(peak_pressure_mpa)
-        metrics["pin_bearing_comp_mpa"] = self.pin_bearing_pressure(peak_force_n)
-        metrics["pin_bearing_tens_mpa"] = self.pin_bearing_pressure(tensile_force_n)
-        metrics["pin_bearing_max_mpa"] = max(metrics["pin_bearing_comp_mpa"], metrics["pin_bearing_tens_mpa"])
+        metrics["mass_g"] = self.mass
+        if sweep:
+            p = np.asarray(peak_pressure_mpa, dtype=float)
+            F_comp = np.asarray(peak_force_n, dtype=float)
+            F_tens = np.asarray(tensile_force_n, dtype=float)
+            r = self.geo.bore_diameter / 2
+            t = self.geo.crown_thickness
+            area = 2 * self.geo.pin_diameter * self.geo.pin_boss_width
+            metrics["crown_bending_mpa"] = (3.0 * p * r * r) / (4.0 * t * t)
+            metrics["pin_bearing_comp_mpa"] = F_comp / area
+            metrics["pin_bearing_tens_mpa"] = F_tens / area
+            metrics["pin_bearing_max_mpa"] = np.maximum(
+                metrics["pin_bearing_comp_mpa"], metrics["pin_bearing_tens_mpa"])
+        else:
+            metrics["crown_bending_mpa"] = self.crown_bending_stress(peak_pressure_mpa)
+            metrics["pin_bearing_comp_mpa"] = self.pin_bearing_pressure(peak_force_n)
+            metrics["pin_bearing_tens_mpa"] = self.pin_bearing_pressure(tensile_force_n)
+            metrics["pin_bearing_max_mpa"] = max(metrics["pin_bearing_comp_mpa"], metrics["pin_bearing_tens_mpa"])
         
         constraints = {}
         constraints["crown_stress_ok"] = metrics["crown_bending_mpa"] < self.geo.yield_strength * 0.67
@@ -103,6 +207,12 @@ class PistonAnalyzer:
         constraints["pin_bearing_tens_ok"] = metrics["pin_bearing_tens_mpa"] < 60.0
         constraints["mass_ok"] = metrics["mass_g"] < 500.0  # target <500g
         
+        all_ok = (constraints["crown_stress_ok"]
+                  & constraints["pin_bearing_comp_ok"]
+                  & constraints["pin_bearing_tens_ok"]
+                  & constraints["mass_ok"])
+        metrics["any_violation"] = ~all_ok if sweep else not all_ok
+        
         return constraints, metrics
 
 # Baseline geometry for 8.0 L V12 (bore ≈ 94.5 mm, stroke 95 mm)
@@ -16,7 +16,7 @@ class RelaxedPistonAnalyzer(PistonAnalyzer):
         if tensile_force_n is None:
             tensile_force_n = peak_force_n
         metrics = {}
-        metrics["mass_g"] = self.mass()
+        metrics["mass_g"] = self.mass
         metrics["crown_bending_mpa"] = self.crown_bending_stress(peak_pressure_mpa)
         metrics["pin_bearing_comp_mpa"] = self.pin_bearing_pressure(peak_force_n)
         metrics["pin_bearing_tens_mpa"] = self.pin_bearing_pressure(tensile_force_n)
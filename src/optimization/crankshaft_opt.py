@@ -121,9 +121,9 @@ def evaluate_individual(vec):
         redline_rpm=REDLINE_RPM
     )
     # Mass is primary objective (minimize)
-    mass = metrics["mass_kg"]
+    mass = metrics.mass_kg
     # Engineering constraint violations
-    violations += sum(1 for v in cons.values() if not v)
+    violations += sum(1 for v in cons if not v)
     return mass, violations
 
 def setup_deap():
@@ -201,10 +201,10 @@ if __name__ == "__main__":
     cons, metrics = analyzer.evaluate_constraints(PEAK_TORQUE, PEAK_CONROD_FORCE, REDLINE_RPM)
     
     print("\nDetailed metrics:")
-    for k, v in metrics.items():
+    for k, v in metrics._asdict().items():
         print(f"  {k}: {v:.2f}")
     print("Constraints satisfied:")
-    for k, v in cons.items():
+    for k, v in cons._asdict().items():
         print(f"  {k}: {v}")
     
     # CAD validation & export
@@ -219,7 +219,7 @@ if __name__ == "__main__":
         else:
             # Compare analytical mass vs CAD volume‑based mass
             cad_mass = cad_volume * geo.density / 1000  # kg
-            anal_mass = metrics["mass_kg"]
+            anal_mass = metrics.mass_kg
             mass_diff_pct = abs(cad_mass - anal_mass) / anal_mass * 100
             print(f"CAD volume: {cad_volume:.0f} mm³ → mass: {cad_mass:.2f} kg")
             print(f"Analytical mass: {anal_mass:.2f} kg (difference: {mass_diff_pct:.1f}%)")
@@ -239,7 +239,8 @@ if __name__ == "__main__":
         
         # Also export STL for quick viewing
         import cadquery as cq
-        cq.exporters.export(crankshaft, "crankshaft_optimized.stl", "STL")
+        cq.exporters.export(crankshaft, "crankshaft_optimized.stl", "STL",
+                            tolerance=0.1, angularTolerance=0.2)
         print("✅ STL exported as 'crankshaft_optimized.stl'")
         
     except Exception as e:
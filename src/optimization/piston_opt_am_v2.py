@@ -7,6 +7,11 @@ import numpy as np
 import random
 import json
 import datetime
+
+try:
+    import orjson  # Rust serializer: ~5× faster than stdlib with indent
+except ImportError:
+    orjson = None
 from deap import base, creator, tools, algorithms
 from src.engine.piston_am import PistonGeometryAM, PistonAnalyzerAM
 
@@ -99,16 +104,22 @@ def evaluate_individual(vec):
     violations += sum(1 for v in cons.values() if not v)
     return mass, violations
 
-def setup_deap():
-    """Configure DEAP toolbox."""
+def setup_deap(rng=None):
+    """Configure DEAP toolbox.
+
+    `rng` is a numpy Generator used for individual initialization; PCG64 is
+    both faster than the legacy global RandomState and safe per-instance
+    when seeds run in parallel workers."""
+    if rng is None:
+        rng = np.random.default_rng()
     creator.create("Fitness", base.Fitness, weights=(-1.0, -100.0))
     creator.create("Individual", list, fitness=creator.Fitness)
-    
+
     toolbox = base.Toolbox()
-    
+
     # Attribute generator
     for i, (key, (low, high)) in enumerate(BOUNDS.items()):
-        toolbox.register(f"attr_{i}", random.uniform, low, high)
+        toolbox.register(f"attr_{i}", rng.uniform, low, high)
     
     # Structure initializers
     toolbox.register(
@@ -128,9 +139,9 @@ def setup_deap():
     
     return toolbox
 
-def run_optimization(pop_size=30, generations=20, cxpb=0.7, mutpb=0.2):
+def run_optimization(pop_size=30, generations=20, cxpb=0.7, mutpb=0.2, rng=None):
     """Run evolutionary optimization."""
-    toolbox = setup_deap()
+    toolbox = setup_deap(rng=rng)
     pop = toolbox.population(n=pop_size)
     
     # Statistics
@@ -165,7 +176,9 @@ def save_results(best, log, feasible, filename=None):
     cons, metrics = analyzer.evaluate_constraints(PEAK_PRESSURE_MPA, PEAK_FORCE_N, TENSILE_FORCE_N)
     
     results = {
-        "best_individual": best,
+        # Plain list — DEAP's Individual is a list subclass, which orjson
+        # (unlike stdlib json) refuses to serialize natively
+        "best_individual": list(best),
         "fitness_mass": best.fitness.values[0],
         "fitness_violations": best.fitness.values[1],
         "geometry": {
@@ -184,11 +197,17 @@ def save_results(best, log, feasible, filename=None):
             "peak_force_n": PEAK_FORCE_N,
             "tensile_force_n": TENSILE_FORCE_N
         },
-        "logbook": log
+        "logbook": list(log)
     }
-    
-    with open(filename, "w") as f:
-        json.dump(results, f, indent=2, default=str)
+
+    if orjson is not None:
+        with open(filename, "wb") as f:
+            f.write(orjson.dumps(
+                results, default=str,
+                option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2))
+    else:
+        with open(filename, "w") as f:
+            json.dump(results, f, indent=2, default=str)
     print(f"Results saved to {filename}")
     return results, filename
 
@@ -225,7 +225,8 @@ def generate_cad(geometry, filename=None):
         # Also export STL for 3D printing
         import cadquery as cq
         stl_filename = filename.replace(".step", ".stl")
-        cq.exporters.export(piston, stl_filename, "STL")
+        cq.exporters.export(piston, stl_filename, "STL",
+                            tolerance=0.1, angularTolerance=0.2)
         print(f"STL model saved to {stl_filename}")
     except ImportError:
         print("CadQuery or piston_cad not installed, skipping CAD generation.")
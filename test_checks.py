@@ -22,10 +22,10 @@ if __name__ == '__main__':
     cons, metrics = analyzer.evaluate_constraints(2800.0, 180000.0, 8500.0)
     
     print("\nMetrics:")
-    for k, v in metrics.items():
+    for k, v in metrics._asdict().items():
         print(f"  {k}: {v:.2f}")
     print("Constraints satisfied:")
-    for k, v in cons.items():
+    for k, v in cons._asdict().items():
         print(f"  {k}: {v}")
     
     # Geometric checks
@@ -33,7 +33,7 @@ if __name__ == '__main__':
     geom_viol = geometric_feasibility(geo)
     print(f"Geometric violations: {geom_viol}")
     
-    if geom_viol == 0 and all(cons.values()):
+    if geom_viol == 0 and all(cons):
         print("\n✅ Enhanced checks passed – design is feasible and non‑degenerate.")
     else:
         print("\n❌ Design fails checks.")
\ No newline at end of file
@@ -128,8 +128,8 @@ def evaluate_individual(vec):
         max_conrod_force_n=PEAK_CONROD_FORCE,
         redline_rpm=REDLINE_RPM
     )
-    mass = metrics["mass_kg"]
-    violations += sum(1 for v in cons.values() if not v)
+    mass = metrics.mass_kg
+    violations += sum(1 for v in cons if not v)
     return mass, violations
 
 def setup_deap():
@@ -216,8 +216,8 @@ def save_results_json(geo, cons, metrics, filename):
             "fillet_pin": geo.fillet_pin,
             "cheek_sector_factor": geo.cheek_sector_factor,
         },
-        "metrics": convert_to_serializable(metrics),
-        "constraints_satisfied": convert_to_serializable(cons),
+        "metrics": convert_to_serializable(metrics._asdict()),
+        "constraints_satisfied": convert_to_serializable(cons._asdict()),
         "bounds": BOUNDS,
     }
     data = convert_to_serializable(data)
@@ -241,10 +241,10 @@ if __name__ == "__main__":
     cons, metrics = analyzer.evaluate_constraints(PEAK_TORQUE, PEAK_CONROD_FORCE, REDLINE_RPM)
     
     print("\nDetailed metrics:")
-    for k, v in metrics.items():
+    for k, v in metrics._asdict().items():
         print(f"  {k}: {v:.2f}")
     print("Constraints satisfied:")
-    for k, v in cons.items():
+    for k, v in cons._asdict().items():
         print(f"  {k}: {v}")
     
     # Save JSON results
@@ -263,7 +263,7 @@ if __name__ == "__main__":
             print("⚠️  CAD volume is zero or negative – geometry may be degenerate.")
         else:
             cad_mass = cad_volume * geo.density / 1000  # kg
-            anal_mass = metrics["mass_kg"]
+            anal_mass = metrics.mass_kg
             mass_diff_pct = abs(cad_mass - anal_mass) / anal_mass * 100
             print(f"CAD volume: {cad_volume:.0f} mm³ → mass: {cad_mass:.2f} kg")
             print(f"Analytical mass: {anal_mass:.2f} kg (difference: {mass_diff_pct:.1f}%)")